@@ -64,9 +64,13 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time: Optional[datetime] = None
         self.state = "CLOSED"
+        self._probe_in_flight = False  # HALF_OPEN admits one trial call at a time
 
-    def call(self, func: Callable, *args, **kwargs) -> Any:
-        """Execute function with circuit breaker protection"""
+    def _admit(self) -> bool:
+        """
+        Raise BotError if the call must be rejected. Returns True when the call
+        is the single HALF_OPEN probe, whose outcome closes or reopens the breaker.
+        """
         if self.state == "OPEN":
             if datetime.now() - self.last_failure_time > timedelta(seconds=self.timeout):
                 logger.info("Circuit breaker transitioning to HALF_OPEN state")
@@ -77,53 +81,68 @@ class CircuitBreaker:
                     "Service temporarily unavailable due to repeated errors. Please try again in a minute."
                 )
 
+        if self.state == "HALF_OPEN":
+            if self._probe_in_flight:
+                raise BotError(
+                    f"Circuit breaker HALF_OPEN - recovery probe in flight",
+                    "Service temporarily unavailable due to repeated errors. Please try again in a minute."
+                )
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def _record_success(self, probe: bool):
+        if probe:
+            logger.info("Circuit breaker transitioning to CLOSED state (recovered)")
+            self.state = "CLOSED"
+            self.failure_count = 0
+
+    def _record_failure(self, probe: bool = False):
+        """
+        Count a failure. While CLOSED, failures older than the reset timeout no
+        longer count, so sporadic errors spread over hours can't add up to an
+        open breaker; a failed HALF_OPEN probe always reopens it.
+        """
+        now = datetime.now()
+        stale = self.last_failure_time and now - self.last_failure_time > timedelta(seconds=self.timeout)
+        if self.state == "CLOSED" and stale:
+            self.failure_count = 0
+        self.failure_count += 1
+        self.last_failure_time = now
+
+        if probe or self.failure_count >= self.failure_threshold:
+            logger.error(f"Circuit breaker opening after {self.failure_count} failures")
+            self.state = "OPEN"
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Execute function with circuit breaker protection"""
+        probe = self._admit()
         try:
             result = func(*args, **kwargs)
-            if self.state == "HALF_OPEN":
-                logger.info("Circuit breaker transitioning to CLOSED state (recovered)")
-                self.state = "CLOSED"
-                self.failure_count = 0
-            return result
-
-        except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = datetime.now()
-
-            if self.failure_count >= self.failure_threshold:
-                logger.error(f"Circuit breaker opening after {self.failure_count} failures")
-                self.state = "OPEN"
-
+        except Exception:
+            self._record_failure(probe)
             raise
+        else:
+            self._record_success(probe)
+            return result
+        finally:
+            if probe:
+                self._probe_in_flight = False
 
     async def call_async(self, func: Callable, *args, **kwargs) -> Any:
         """Execute async function with circuit breaker protection"""
-        if self.state == "OPEN":
-            if datetime.now() - self.last_failure_time > timedelta(seconds=self.timeout):
-                logger.info("Circuit breaker transitioning to HALF_OPEN state")
-                self.state = "HALF_OPEN"
-            else:
-                raise BotError(
-                    f"Circuit breaker OPEN - too many failures",
-                    "Service temporarily unavailable due to repeated errors. Please try again in a minute."
-                )
-
+        probe = self._admit()
         try:
             result = await func(*args, **kwargs)
-            if self.state == "HALF_OPEN":
-                logger.info("Circuit breaker transitioning to CLOSED state (recovered)")
-                self.state = "CLOSED"
-                self.failure_count = 0
-            return result
-
-        except Exception as e:
-            self.failure_count += 1
-            self.last_failure_time = datetime.now()
-
-            if self.failure_count >= self.failure_threshold:
-                logger.error(f"Circuit breaker opening after {self.failure_count} failures")
-                self.state = "OPEN"
-
+        except Exception:
+            self._record_failure(probe)
             raise
+        else:
+            self._record_success(probe)
+            return result
+        finally:
+            if probe:
+                self._probe_in_flight = False
 
 
 # Global circuit breakers for different services
@@ -4,8 +4,12 @@ Receives WhatsApp messages via Twilio webhook and responds using Claude API with
 """
 
 import os
+import base64
+import io
+import tempfile
+import httpx
 from fastapi import FastAPI, Form, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, ORJSONResponse
 from twilio.twiml.messaging_response import MessagingResponse
 from twilio.rest import Client
 import anthropic
@@ -37,7 +41,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="WhatsApp Claude MCP Bot")
+app = FastAPI(
+    title="WhatsApp Claude MCP Bot",
+    default_response_class=ORJSONResponse
+)
 
 # Clients will be initialized during startup from GSM
 twilio_client = None
@@ -133,6 +140,13 @@ async def startup_event():
         logger.warning(f"⚠️  OpenAI API key not found in GSM: {str(e)}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled connections on shutdown"""
+    await mcp_client.close()
+    logger.info("✅ MCP client closed")
+
+
 @app.get("/")
 async def root():
     """Basic health check endpoint"""
@@ -198,8 +212,6 @@ async def process_audio_transcription(media_bytes: bytes, media_type: str) -> st
         )
 
     async with ErrorContext("transcribing audio", log_errors=True) as ctx:
-        import tempfile
-
         # Save audio temporarily for Whisper API
         with tempfile.NamedTemporaryFile(suffix=".ogg", delete=False) as temp_audio:
             temp_audio.write(media_bytes)
@@ -229,9 +241,7 @@ async def process_audio_transcription(media_bytes: bytes, media_type: str) -> st
 async def process_image(media_bytes: bytes, media_type: str) -> dict:
     """Process image with compression and validation"""
     async with ErrorContext("processing image", log_errors=True) as ctx:
-        import base64
         from PIL import Image
-        import io
 
         # Normalize media type
         media_type = media_type.lower()
@@ -348,8 +358,6 @@ async def whatsapp_webhook(
             logger.info(f"[{request_id}] 📎 Processing media: {MediaContentType0} from {MediaUrl0}")
 
             try:
-                import httpx
-
                 # Download media from Twilio with timeout
                 async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
                     async with ErrorContext(f"downloading media from Twilio", log_errors=True) as ctx:
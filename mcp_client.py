@@ -5,25 +5,606 @@ Connects to MCP servers and executes tool calls from Claude
 
 import os
 import asyncio
-import json
+import base64
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import time
+import random
+import re
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from email import encoders, policy
+from email.header import Header
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.parser import BytesParser
+from email.utils import formataddr, getaddresses, parsedate_to_datetime
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, AsyncIterator, Mapping
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+from multidict import CIMultiDict, CIMultiDictProxy
 from anthropic import Anthropic
 from anthropic.types import Message, TextBlock, ToolUseBlock
 
+from error_handler import BotError, CircuitBreaker
+
+try:
+    import ijson
+except ImportError:  # Streaming parse is optional, fall back to a buffered parse
+    ijson = None
+
+try:
+    import pybase64 as fast_b64
+except ImportError:  # SIMD base64 is optional, the stdlib codec is a drop-in
+    import base64 as fast_b64
+
+try:
+    import fastjsonschema
+except ImportError:  # Input validation is skipped without fastjsonschema
+    fastjsonschema = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # fetch_webpage reports an error without beautifulsoup4
+    BeautifulSoup = None
+
 logger = logging.getLogger(__name__)
 
 
+# Static success results shared by the delete handlers. Tool results are
+# only serialized, never mutated, so returning the same dict is safe.
+_SUCCESS = {"success": True}
+_LABEL_DELETED = {"success": True, "message": "Label deleted"}
+_PROJECT_DELETED = {"success": True, "message": "Project deleted"}
+_SECTION_DELETED = {"success": True, "message": "Section deleted"}
+_COMMENT_DELETED = {"success": True, "message": "Comment deleted"}
+_DRAFT_DELETED = {"success": True, "message": "Draft deleted"}
+_FILTER_DELETED = {"success": True, "message": "Filter deleted"}
+
+
+# Angle-bracket address at the end of a From header ("Name <addr>"). Anchored
+# to the end so a quoted display name containing "<" is skipped.
+_ADDR_RE = re.compile(r"<([^<>]+)>\s*$")
+
+# Subscribed holiday/sports calendars skipped when listing events
+_SKIP_CALENDAR_RE = re.compile(r"holiday@|#sports@")
+
+# Place Details fields requested when the caller doesn't name any
+_DEFAULT_PLACE_FIELDS = ",".join((
+    "name", "formatted_address", "formatted_phone_number", "website",
+    "opening_hours", "rating", "user_ratings_total", "reviews",
+    "price_level", "business_status"
+))
+
+# Shared stand-in for a missing nested object in API results, so lookups
+# like (place.get("geometry") or _EMPTY).get("location") don't allocate
+_EMPTY = MappingProxyType({})
+
+# Bold tags Google Directions wraps around street names in step instructions
+_BOLD_TAG_RE = re.compile(r"</?b>")
+
+# Per-message query for search results: headers and snippet only, no body
+_GMAIL_METADATA_QUERY = (
+    "format=metadata&metadataHeaders=Subject&metadataHeaders=From"
+    "&metadataHeaders=Date&fields=id,snippet,payload/headers"
+)
+
+
+_SUMMARY_HEADERS = frozenset(("From", "Subject", "Date"))
+
+
+def _extract_headers(payload: Dict[str, Any], wanted: Optional[frozenset] = None) -> Dict[str, str]:
+    """
+    Map header name -> value for a Gmail message payload in a single pass.
+    With wanted, only those headers are kept and the scan stops once all are found.
+    """
+    if wanted is None:
+        return {h["name"]: h["value"] for h in payload.get("headers", [])}
+
+    found = {}
+    for h in payload.get("headers", ()):
+        name = h["name"]
+        if name in wanted:
+            found[name] = h["value"]
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+def _decode_body_prefix(body_data: str, max_chars: int = 5000) -> str:
+    """Decode just enough of a base64url Gmail body to yield max_chars characters"""
+    # 4 UTF-8 bytes per char worst case, 4 base64 chars per 3 bytes
+    b64_slice = body_data[:-(-max_chars * 4 // 3) * 4]
+    b64_slice += "=" * (-len(b64_slice) % 4)
+    return fast_b64.urlsafe_b64decode(b64_slice).decode('utf-8', errors='ignore')[:max_chars]
+
+
+def _event_date(value) -> str:
+    """YYYY-MM-DD part of an ISO timestamp or datetime, for all-day events"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    return value[:10]
+
+
+def _event_time(value) -> str:
+    """RFC 3339 string for a timed event from an ISO timestamp or datetime"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_timestamp(value: str) -> int:
+    """Unix seconds for an ISO 8601 timestamp (trailing Z allowed); raises ValueError"""
+    return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+
+def _web_search_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Result entry for a Custom Search web hit"""
+    return {
+        "title": item.get("title"),
+        "link": item.get("link"),
+        "snippet": item.get("snippet"),
+        "display_link": item.get("displayLink")
+    }
+
+
+def _image_search_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Result entry for a Custom Search image hit"""
+    image = item.get("image") or _EMPTY
+    return {
+        "title": item.get("title"),
+        "link": item.get("link"),
+        "thumbnail": image.get("thumbnailLink"),
+        "context": image.get("contextLink")
+    }
+
+
+def _mime_header(value: str) -> str:
+    """Header value safe for a hand-built message: no line breaks, RFC 2047 if non-ASCII"""
+    value = " ".join(str(value).splitlines())
+    if value.isascii():
+        return value
+    return Header(value, "utf-8").encode(linesep="\r\n")
+
+
+def _mime_address(value: str) -> str:
+    """
+    Address header value for a hand-built message. Only display names are
+    RFC 2047 encoded; an encoded addr-spec would no longer be an address.
+    """
+    value = " ".join(str(value).splitlines())
+    if value.isascii():
+        return value
+    return ", ".join(formataddr(pair, charset="utf-8") for pair in getaddresses([value]))
+
+
+def _build_raw_message(to: str, subject: str, body: str, sender: str,
+                       in_reply_to: Optional[str] = None) -> bytes:
+    """
+    Build a text/plain RFC 5322 message directly, skipping the MIMEText
+    object tree and generator. Output matches what MIMEText(body) produced,
+    with CRLF line endings throughout.
+    """
+    lines = [
+        f"To: {_mime_address(to)}",
+        f"Subject: {_mime_header(subject)}",
+        f"From: {_mime_address(sender)}",
+    ]
+    if in_reply_to:
+        lines.append(f"In-Reply-To: {_mime_header(in_reply_to)}")
+        lines.append(f"References: {_mime_header(in_reply_to)}")
+    lines.append("MIME-Version: 1.0")
+
+    if body.isascii():
+        lines.append('Content-Type: text/plain; charset="us-ascii"')
+        lines.append("Content-Transfer-Encoding: 7bit")
+        payload = body
+    else:
+        lines.append('Content-Type: text/plain; charset="utf-8"')
+        lines.append("Content-Transfer-Encoding: base64")
+        payload = fast_b64.encodebytes(body.encode("utf-8")).decode("ascii").replace("\n", "\r\n")
+
+    return ("\r\n".join(lines) + "\r\n\r\n" + payload).encode("utf-8")
+
+
+# Decoded attachment bytes are collected into blocks this size before each
+# file write, which runs in a worker thread to keep disk I/O off the event loop
+_WRITE_BLOCK_SIZE = 1024 * 1024
+
+
+async def _stream_b64_field(chunks: AsyncIterator[bytes], field: bytes, out) -> int:
+    """
+    Decode the base64url string value of a top-level JSON field from a byte
+    stream and write it to out as it arrives. Memory stays at about one write
+    block instead of the JSON text, the encoded string and the decoded file at once.
+    Base64url values contain no escapes, so the first quote ends the value.
+    Returns the number of decoded bytes written.
+    """
+    key = b'"' + field + b'"'
+    buffer = b""
+    in_value = False
+    written = 0
+    pending = bytearray()
+
+    async for chunk in chunks:
+        buffer += chunk
+        if not in_value:
+            start = buffer.find(key)
+            if start == -1:
+                buffer = buffer[-len(key):]  # Keep a possible partial key
+                continue
+            quote = buffer.find(b'"', start + len(key))
+            if quote == -1:
+                continue  # The ':' and opening quote haven't arrived yet
+            buffer = buffer[quote + 1:]
+            in_value = True
+
+        end = buffer.find(b'"')
+        encoded = buffer if end == -1 else buffer[:end]
+        usable = len(encoded) - len(encoded) % 4 if end == -1 else len(encoded)
+        if usable:
+            piece = encoded[:usable]
+            if end != -1:
+                piece += b"=" * (-len(piece) % 4)
+            decoded = fast_b64.urlsafe_b64decode(piece)
+            pending += decoded
+            written += len(decoded)
+        if end != -1:
+            if pending:
+                await asyncio.to_thread(out.write, bytes(pending))
+            return written
+        if len(pending) >= _WRITE_BLOCK_SIZE:
+            await asyncio.to_thread(out.write, bytes(pending))
+            pending.clear()
+        buffer = encoded[usable:]
+
+    raise ValueError(f"Field {field.decode()} not found or truncated in response")
+
+
+def _build_advanced_message(params: Dict[str, Any]) -> str:
+    """
+    Build and base64url-encode the multipart message for gmail_send_advanced.
+    Blocking (reads attachment files), so callers run it in a worker thread.
+    """
+    # Create message
+    message = MIMEMultipart()
+    message["to"] = params["to"]
+    message["subject"] = params["subject"]
+
+    if params.get("cc"):
+        message["cc"] = params["cc"]
+    if params.get("bcc"):
+        message["bcc"] = params["bcc"]
+
+    # Add body
+    body_type = "html" if params.get("html") else "plain"
+    message.attach(MIMEText(params["body"], body_type))
+
+    # Add attachments if any
+    if params.get("attachment_paths"):
+        for file_path in params["attachment_paths"]:
+            if os.path.exists(file_path):
+                with open(file_path, "rb") as f:
+                    part = MIMEBase("application", "octet-stream")
+                    part.set_payload(f.read())
+                encoders.encode_base64(part)
+                part.add_header("Content-Disposition", f"attachment; filename={os.path.basename(file_path)}")
+                message.attach(part)
+
+    # Encode message
+    return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+
+class _UpstreamError(Exception):
+    """A 5xx that survived retries, raised only so the circuit breaker records it"""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status}")
+        self.response = response
+
+
+class _AdaptiveBulkhead:
+    """
+    Concurrency limit for one backend, tuned AIMD-style like TCP congestion control:
+    each success faster than target_latency adds 0.5 to the limit (up to max_limit),
+    each 429/5xx/connection failure halves it (down to min_limit).
+    """
+
+    def __init__(self, max_limit: int, target_latency: float, min_limit: int = 1):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.target_latency = target_latency
+        self.limit = float(max_limit)
+        self._in_flight = 0
+        self._slot_freed = asyncio.Condition()
+
+    async def acquire(self):
+        """Wait for a free slot under the current limit"""
+        async with self._slot_freed:
+            await self._slot_freed.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self):
+        """Give back a slot taken by acquire()"""
+        async with self._slot_freed:
+            self._in_flight -= 1
+            # notify_all: a raised limit can admit more than one waiter
+            self._slot_freed.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+        return False
+
+    def record(self, latency: Optional[float], ok: bool):
+        """Adjust the limit after a request; latency is None when it never completed"""
+        if ok:
+            if latency is not None and latency <= self.target_latency:
+                self.limit = min(self.max_limit, self.limit + 0.5)
+        else:
+            self.limit = max(self.min_limit, self.limit * 0.5)
+
+
+def _dump_json(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with orjson"""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def _load_json(data) -> Any:
+    """Parse JSON bytes or str with orjson"""
+    return orjson.loads(data)
+
+
+# Fixed User-Agent for the API sessions, so every call identifies the bot
+# without aiohttp building its default header per request
+_SESSION_HEADERS = CIMultiDictProxy(CIMultiDict({"User-Agent": "WhatsApp-Claude-Bot/1.0"}))
+
+
+def _dumps_str(obj: Any) -> str:
+    """json_serialize hook for the aiohttp sessions"""
+    return _dump_json(obj).decode()
+
+
+def _frozen_headers(*base, **extra) -> CIMultiDictProxy:
+    """
+    Build a read-only header multidict once, so aiohttp can merge it per request
+    without re-wrapping a plain dict, and callers can't mutate the shared copy.
+    """
+    return CIMultiDictProxy(CIMultiDict(*base, **extra))
+
+
+# Upstream error bodies can be whole HTML pages; tool results go into Claude's
+# context, so keep only the start of them
+_MAX_ERROR_TEXT = 512
+
+
+async def _error_text(response) -> str:
+    """Body of an error response, truncated to _MAX_ERROR_TEXT characters"""
+    text = await response.text()
+    if len(text) > _MAX_ERROR_TEXT:
+        return text[:_MAX_ERROR_TEXT] + "..."
+    return text
+
+
+async def _api_error(provider: str, response) -> Dict[str, Any]:
+    """Failure result for a non-success API response, with the truncated error body"""
+    error_text = await _error_text(response)
+    return {"success": False, "error": f"{provider} API error: {response.status} - {error_text}"}
+
+
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+_BATCH_ITEM_RE = re.compile(rb"Content-ID:\s*<(?:response-)?item-(\d+)>", re.IGNORECASE)
+_BLANK_LINE_RE = re.compile(rb"\r?\n\r?\n")
+
+
+def _parse_gmail_batch(raw: bytes, content_type: str, count: int) -> List[Optional[Dict[str, Any]]]:
+    """
+    Split a Gmail multipart/mixed batch reply into the JSON bodies of its
+    embedded HTTP responses, indexed by the item-N Content-ID of each request.
+    Works on bytes throughout so UTF-8 in the bodies reaches the JSON parser intact;
+    parts that are missing or not 200 stay None.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * count
+    match = _BOUNDARY_RE.search(content_type)
+    if not match:
+        return results
+
+    for part in raw.split(b"--" + match.group(1).encode()):
+        # Part headers (Content-ID), then the embedded status line + headers, then the body
+        sections = _BLANK_LINE_RE.split(part, maxsplit=2)
+        if len(sections) < 3:
+            continue
+        part_headers, http_head, body = sections
+        item = _BATCH_ITEM_RE.search(part_headers)
+        if not item:
+            continue
+        status_fields = http_head.lstrip().split(None, 2)
+        if len(status_fields) < 2 or status_fields[1] != b"200":
+            continue
+        index = int(item.group(1))
+        if index < count:
+            results[index] = _load_json(body.strip())
+    return results
+
+
+async def _read_json(response) -> Any:
+    """Parse a JSON response body with orjson"""
+    body = await response.read()
+    if not body.strip():
+        return None  # Same as aiohttp's response.json() for empty bodies
+    return _load_json(body)
+
+
 class MCPClient:
     """
     Simple MCP client that connects to configured MCP servers
     Starts with Todoist, will expand to Gmail, Calendar, etc.
     """
 
-    def __init__(self):
+    # Tool input keys passed straight through to the Todoist API
+    _TODOIST_FILTER_KEYS = ("filter", "project_id", "label", "priority")
+    _TODOIST_TASK_UPDATE_KEYS = ("content", "description", "due_string", "priority", "labels")
+
+    # Read-mostly tools whose results are memoized for a short time
+    _CACHEABLE_TOOLS = {
+        "todoist_list_projects",
+        "todoist_list_labels",
+        "todoist_list_sections",
+        "todoist_list_comments",
+        "gmail_list_labels",
+        "gmail_list_filters",
+        "gmail_list_drafts",
+        "gmail_get_thread",
+        "calendar_list_calendars",
+        "calendar_search_events",
+        "google_maps_search_places",
+        "google_maps_get_place_details",
+    }
+    # Cacheable tools whose results stay valid longer than _RESULT_CACHE_TTL
+    _RESULT_CACHE_TTLS = {
+        "google_maps_search_places": 600,  # seconds
+        "google_maps_get_place_details": 86400,
+    }
+    # Write tools and the cached read tools they make stale
+    _CACHE_INVALIDATIONS = {
+        "todoist_create_project": ("todoist_list_projects",),
+        "todoist_update_project": ("todoist_list_projects",),
+        "todoist_delete_project": ("todoist_list_projects", "todoist_list_sections", "todoist_list_comments"),
+        "todoist_create_label": ("todoist_list_labels",),
+        "todoist_update_label": ("todoist_list_labels",),
+        "todoist_delete_label": ("todoist_list_labels",),
+        "todoist_create_section": ("todoist_list_sections",),
+        "todoist_update_section": ("todoist_list_sections",),
+        "todoist_delete_section": ("todoist_list_sections",),
+        "todoist_add_comment": ("todoist_list_comments",),
+        "todoist_update_comment": ("todoist_list_comments",),
+        "todoist_delete_comment": ("todoist_list_comments",),
+        "todoist_delete_task": ("todoist_list_comments",),
+        "gmail_create_label": ("gmail_list_labels",),
+        "gmail_update_label": ("gmail_list_labels", "gmail_get_thread"),
+        "gmail_delete_label": ("gmail_list_labels", "gmail_get_thread"),
+        "gmail_create_filter": ("gmail_list_filters",),
+        "gmail_delete_filter": ("gmail_list_filters",),
+        "gmail_create_draft": ("gmail_list_drafts", "gmail_get_thread"),
+        "gmail_delete_draft": ("gmail_list_drafts", "gmail_get_thread"),
+        "gmail_send_draft": ("gmail_list_drafts", "gmail_get_thread"),
+        "gmail_send": ("gmail_get_thread",),
+        "gmail_send_advanced": ("gmail_get_thread",),
+        "gmail_reply": ("gmail_get_thread",),
+        "gmail_delete": ("gmail_get_thread",),
+        "gmail_archive": ("gmail_get_thread",),
+        "gmail_mark_read": ("gmail_get_thread",),
+        "gmail_add_label": ("gmail_get_thread",),
+        "gmail_remove_label": ("gmail_get_thread",),
+        "gmail_modify_labels": ("gmail_get_thread",),
+        "calendar_create_event": ("calendar_search_events",),
+        "calendar_create_event_advanced": ("calendar_search_events",),
+        "calendar_update_event": ("calendar_search_events",),
+        "calendar_delete_event": ("calendar_search_events",),
+        "calendar_add_attendee": ("calendar_search_events",),
+        "calendar_remove_attendee": ("calendar_search_events",),
+    }
+    _RESULT_CACHE_TTL = 30  # seconds
+
+    _TOOL_CONCURRENCY = 8  # tool calls from one Claude turn executed at once
+
+    # Transient statuses worth retrying with backoff
+    _RETRY_STATUSES = {429, 500, 502, 503, 504}
+    # A POST may have been applied before a 5xx or dropped connection (e.g. an
+    # email already sent), so non-idempotent requests only retry on 429
+    _IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+    _MAX_RETRIES = 5
+    _MAX_RETRY_DELAY = 32  # seconds
+
+    # Connections per host for each backend's pooled session
+    _SESSION_LIMITS = {
+        "todoist": 20,  # api.todoist.com
+        "gmail": 50,  # gmail.googleapis.com
+        "google": 50,  # www.googleapis.com: Calendar, Custom Search
+        "maps": 20,  # maps.googleapis.com: Places, Directions
+        "web": 10,  # arbitrary pages fetched by fetch_webpage
+    }
+
+    # Hosts with their own backend session; other Google hosts share "google"
+    _BACKEND_HOSTS = {
+        "api.todoist.com": "todoist",
+        "gmail.googleapis.com": "gmail",
+        "maps.googleapis.com": "maps",
+    }
+    # Maximum concurrent requests per backend, below each API's burst rate limit.
+    # The live limit backs off from this on 429/5xx and recovers on fast successes.
+    _BULKHEAD_TARGET_LATENCY = 2.0  # seconds
+    _BULKHEAD_LIMITS = {
+        "todoist": 10,
+        "gmail": 20,
+        "google": 20,
+        "maps": 10,
+        "web": 10,
+    }
+    _BREAKER_FAILURES = 5  # failed requests before a backend's breaker opens
+    _BREAKER_RESET = 30  # seconds before an open breaker lets a trial request through
+
+    _LABEL_CACHE_TTL = 60  # seconds, Gmail label sets rarely change
+    _OWNED_CALENDAR_CACHE_TTL = 300  # seconds, calendar lists change even less
+    _RESULT_CACHE_MAX_ENTRIES = 128
+    _ETAG_CACHE_MAX_ENTRIES = 128
+    _SECRET_CACHE_TTL = 3600  # seconds
+
+    # Todoist writes queued within this window share one Sync API request
+    _TODOIST_SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+    _TODOIST_BATCH_WINDOW = 0.01  # seconds
+    _TODOIST_BATCH_MAX = 20  # commands per request
+
+    # Hosts whose DNS and TLS handshakes are done at startup, per backend session
+    _WARMUP_HOSTS = {
+        "todoist": "https://api.todoist.com/",
+        "gmail": "https://gmail.googleapis.com/",
+        "google": "https://www.googleapis.com/",
+        "maps": "https://maps.googleapis.com/",
+    }
+    _WARMUP_TIMEOUT = 5  # seconds
+
+    def __init__(self, bulkhead_limits: Optional[Dict[str, int]] = None):
+        """bulkhead_limits overrides _BULKHEAD_LIMITS for the given backends"""
         self.anthropic_client = None  # Will be initialized in initialize()
         self.available_tools = []
         self.mcp_servers = {}
+        self._validators = {}
+        self._result_cache = OrderedDict()  # {key: (stored_at, result)}
+        self._sessions = {}  # {backend: aiohttp session}, each created on first use
+        # Connection pool sizes per backend session, overridable for load tuning
+        self._http_limit = int(os.getenv("MCP_HTTP_LIMIT", "100"))
+        per_host = os.getenv("MCP_HTTP_LIMIT_PER_HOST")
+        self._http_limit_per_host = int(per_host) if per_host else None
+        self._bulkhead_limits = {**self._BULKHEAD_LIMITS, **(bulkhead_limits or {})}
+        self._bulkheads = {}  # {backend: _AdaptiveBulkhead}
+        self._throttled_until = {}  # {backend: monotonic time before which nothing is sent}
+        self._breakers = {}  # {backend: CircuitBreaker}
+        self._label_cache = {}  # {account: (fetched_at, raw Gmail labels)}
+        self._owned_calendar_cache = {}  # {account: (fetched_at, owned calendars)}
+        self._google_token_cache = {}  # {account: resolved OAuth token}
+        self._secrets_client = None  # Secret Manager client, created on first use
+        self._secret_cache = {}  # {(project_id, secret_name): (fetched_at, value)}
+        self._etag_cache = OrderedDict()  # {(account, url): (ETag, parsed body)} for conditional GETs, LRU
+        self._auth_headers = {}  # {(token, json_body): read-only header multidict}
+        self._todoist_pending = []  # [(sync command, future)] waiting for the next flush
+        self._todoist_flush_handle = None  # Timer for the pending batch
+        self._todoist_flushes = set()  # In-flight flush tasks, kept referenced until done
+        self._warmup_task = None  # Background connection warmup started by initialize()
 
     async def initialize(self):
         """Initialize connections to MCP servers"""
@@ -46,9 +627,14 @@ class MCPClient:
 
         # Load credentials - try Secret Manager first, fallback to env
         self.todoist_token = os.getenv("TODOIST_API_TOKEN")
+        # The Todoist token is fixed for the process, so build its headers once
+        self._todoist_headers = _frozen_headers(Authorization=f"Bearer {self.todoist_token}")
+        self._todoist_headers_json = _frozen_headers(self._todoist_headers, **{"Content-Type": "application/json"})
         self.google_user_email = os.getenv("GOOGLE_USER_EMAIL", "saad@sakbark.com")
 
         # Try to get both Google OAuth tokens from Secret Manager
+        self._google_token_cache = {}
+        self._auth_headers = {}
         self.google_oauth_token_work = await self._get_secret("google-oauth-token-work")
         self.google_oauth_token_personal = await self._get_secret("google-oauth-token-personal")
 
@@ -101,12 +687,34 @@ class MCPClient:
 
         logger.info(f"Total tools available: {len(self.available_tools)}")
 
+        self._compile_validators()
+
+        # Open the API connections in the background so the first message doesn't pay for them
+        self._warmup_task = asyncio.create_task(self.warmup())
+
+    def _compile_validators(self):
+        """Compile each tool's input_schema once so execute_tool can reject bad input early"""
+        self._validators = {}
+        if fastjsonschema is None:
+            logger.warning("fastjsonschema not installed - tool input validation disabled")
+            return
+
+        for tool in self.available_tools:
+            try:
+                self._validators[tool["name"]] = fastjsonschema.compile(tool["input_schema"])
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                logger.warning(f"Could not compile schema for {tool['name']}: {str(e)}")
+
     def _get_active_google_token(self) -> str:
         """
         Get the appropriate Google OAuth token based on active account.
         Falls back to work token if active_account not set.
+        The resolved token is memoized per account until tokens are reloaded.
         """
         active = getattr(self, 'active_account', 'personal')
+        token = self._google_token_cache.get(active)
+        if token is not None:
+            return token
 
         if active == "work":
             token = self.google_oauth_token_work
@@ -124,8 +732,306 @@ class MCPClient:
             logger.warning("Work token not available, falling back to legacy token")
             token = self.google_oauth_token
 
+        if token:
+            self._google_token_cache[active] = token
         return token
 
+    def _google_headers(self, json_body: bool = False) -> Mapping[str, str]:
+        """
+        Return auth headers for the active Google token, built once per token
+        and kept for every account, so switching accounts doesn't rebuild them.
+        The headers are shared read-only multidicts.
+        """
+        key = (self._get_active_google_token(), json_body)
+        headers = self._auth_headers.get(key)
+        if headers is None:
+            extra = {"Content-Type": "application/json"} if json_body else {}
+            headers = self._auth_headers[key] = _frozen_headers(Authorization=f"Bearer {key[0]}", **extra)
+        return headers
+
+    async def _session(self, backend: str = "google"):
+        """
+        Return the pooled aiohttp session for a backend, creating it on first use.
+        Reusing sessions keeps connections alive between calls; one per backend
+        means a throttled Todoist can't tie up the connections Gmail needs.
+        Creation needs no lock: nothing is awaited between the check and the store.
+        """
+        session = self._sessions.get(backend)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._http_limit,
+                    limit_per_host=self._http_limit_per_host or self._SESSION_LIMITS[backend],
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True  # reclaim TLS sockets the peer never closed cleanly
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+                json_serialize=_dumps_str,
+                headers=_SESSION_HEADERS
+            )
+            self._sessions[backend] = session
+        return session
+
+    async def warmup(self):
+        """
+        Resolve and open a pooled connection to each configured API host.
+        Errors are ignored; a failed warmup only means the first real call
+        connects as it would have anyway.
+        """
+        backends = []
+        if self.todoist_token:
+            backends.append("todoist")
+        if self.google_oauth_token:
+            backends.extend(("gmail", "google"))
+        elif self.google_custom_search_api_key:
+            backends.append("google")
+        if self.google_maps_api_key:
+            backends.append("maps")
+
+        async def _probe(backend: str):
+            session = await self._session(backend)
+            # Unauthenticated HEAD: the reply is discarded, the connection stays in the pool
+            async with session.head(
+                self._WARMUP_HOSTS[backend],
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=self._WARMUP_TIMEOUT)
+            ):
+                pass
+
+        results = await asyncio.gather(*(_probe(b) for b in backends), return_exceptions=True)
+        for backend, result in zip(backends, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Connection warmup failed for {backend}: {str(result)}")
+        logger.info(f"Warmed up connections for: {', '.join(backends) or 'none'}")
+
+    async def close(self):
+        """Close the pooled HTTP sessions (called on application shutdown)"""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+
+    async def _request(self, method: str, url: str, read_body: bool = True, **kwargs):
+        """
+        Send an API request on the backend's pooled session, at most
+        _BULKHEAD_LIMITS in flight per backend, retrying 429/5xx and
+        connection errors with exponential backoff (honors Retry-After).
+        The body is read before returning, so callers can use
+        _read_json(response)/text() after the connection is back in the pool.
+        Callers that only check the status pass read_body=False, which skips
+        the read for a bodiless 204. Any other body is still drained, since
+        releasing an unread response closes its connection instead of pooling it.
+
+        Each backend has a circuit breaker: after repeated 5xx or connection
+        failures it raises BotError immediately instead of waiting on a dead API.
+        """
+        backend = self._BACKEND_HOSTS.get(urlsplit(url).hostname, "google")
+        try:
+            return await self._breaker(backend).call_async(
+                self._send_with_retries, backend, method, url, read_body, **kwargs
+            )
+        except _UpstreamError as e:
+            return e.response
+
+    def _breaker(self, backend: str) -> CircuitBreaker:
+        """Circuit breaker for one backend, created on first use"""
+        breaker = self._breakers.get(backend)
+        if breaker is None:
+            breaker = self._breakers[backend] = CircuitBreaker(
+                failure_threshold=self._BREAKER_FAILURES, timeout=self._BREAKER_RESET
+            )
+        return breaker
+
+    async def _get_json_revalidated(self, url: str, headers, **kwargs):
+        """
+        GET a JSON resource, sending If-None-Match when an earlier response had
+        an ETag so an unchanged resource comes back as an empty 304.
+        Returns (response, parsed body); the body is None for error responses
+        and {} for a 200 with an empty body.
+        """
+        key = (getattr(self, "active_account", "personal"), url)
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = await self._request("GET", url, headers=headers, **kwargs)
+        if response.status == 304 and cached:
+            if key in self._etag_cache:
+                self._etag_cache.move_to_end(key)
+            return response, cached[1]
+        if response.status != 200:
+            return response, None
+
+        data = await _read_json(response)
+        if data is None:
+            data = {}  # Empty resource, not an error
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, data)
+            self._etag_cache.move_to_end(key)
+            while len(self._etag_cache) > self._ETAG_CACHE_MAX_ENTRIES:
+                self._etag_cache.popitem(last=False)
+        return response, data
+
+    def _bulkhead(self, backend: str) -> _AdaptiveBulkhead:
+        """Adaptive limit on concurrent requests to one backend, created on first use"""
+        bulkhead = self._bulkheads.get(backend)
+        if bulkhead is None:
+            bulkhead = self._bulkheads[backend] = _AdaptiveBulkhead(
+                self._bulkhead_limits[backend], self._BULKHEAD_TARGET_LATENCY
+            )
+        return bulkhead
+
+    async def _send_with_retries(
+        self, backend: str, method: str, url: str, read_body: bool, stream: bool = False, **kwargs
+    ):
+        """
+        Retry loop behind _request and _stream_get; raises _UpstreamError for a
+        final 5xx so the breaker counts it. With stream=True a successful (< 300)
+        response comes back unread and still holding its bulkhead slot; the
+        caller must release both once the body has been consumed.
+        """
+        session = await self._session(backend)
+        bulkhead = self._bulkhead(backend)
+        idempotent = method in self._IDEMPOTENT_METHODS
+        retry_statuses = self._RETRY_STATUSES if idempotent else {429}
+
+        for attempt in range(self._MAX_RETRIES + 1):
+            await self._wait_for_rate_limit(backend)
+            await bulkhead.acquire()
+            keep_slot = False
+            try:
+                started = time.monotonic()
+                try:
+                    response = await session.request(method, url, **kwargs)
+                    keep_slot = stream and response.status < 300
+                    if not keep_slot:
+                        try:
+                            if read_body or response.status != 204:
+                                await response.read()
+                        finally:
+                            response.release()
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    bulkhead.record(None, ok=False)
+                    raise
+                bulkhead.record(
+                    time.monotonic() - started,
+                    ok=response.status != 429 and response.status < 500
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not idempotent or attempt == self._MAX_RETRIES:
+                    raise
+                delay = self._retry_delay(None, attempt)
+                logger.warning(f"{method} {url} failed ({str(e)}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            finally:
+                if not keep_slot:
+                    await bulkhead.release()
+
+            throttle = self._track_rate_limit(backend, response, attempt)
+            if response.status not in retry_statuses or attempt == self._MAX_RETRIES:
+                if response.status >= 500:
+                    raise _UpstreamError(response)
+                return response
+
+            delay = throttle if throttle is not None else self._retry_delay(response, attempt)
+            logger.warning(f"{method} {url} returned {response.status}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def _stream_get(self, backend: str, url: str, **kwargs):
+        """
+        GET whose body the caller streams, for responses too large to buffer
+        through _request. Opening the response goes through the same breaker,
+        retries and bulkhead as _request; the bulkhead slot is held until the
+        caller is done with the body, and nothing is retried after that.
+        """
+        try:
+            response = await self._breaker(backend).call_async(
+                self._send_with_retries, backend, "GET", url, False, stream=True, **kwargs
+            )
+        except _UpstreamError as e:
+            # Final 5xx: body already read and slot already released
+            yield e.response
+            return
+
+        try:
+            yield response
+        finally:
+            response.release()
+            if response.status < 300:
+                await self._bulkhead(backend).release()
+
+    def _track_rate_limit(self, backend: str, response, attempt: int) -> Optional[float]:
+        """
+        Pause the whole backend when a response says its rate limit is spent:
+        a 429, or X-RateLimit-Remaining of 0 with an X-RateLimit-Reset.
+        Returns the pause in seconds, or None when the backend has headroom.
+        """
+        if response.status == 429:
+            delay = self._retry_delay(response, attempt)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                reset = float(response.headers.get("X-RateLimit-Reset", ""))
+            except ValueError:
+                return None
+            # Some APIs send the reset as an epoch timestamp, others as seconds to wait
+            delay = reset - time.time() if reset > 1e9 else reset
+            delay = min(max(delay, 0.0), self._MAX_RETRY_DELAY)
+        else:
+            return None
+
+        until = time.monotonic() + delay
+        if until > self._throttled_until.get(backend, 0.0):
+            self._throttled_until[backend] = until
+            logger.warning(f"{backend} rate limit reached, pausing requests for {delay:.1f}s")
+        return delay
+
+    async def _wait_for_rate_limit(self, backend: str):
+        """Sleep until the backend's rate-limit pause (if any) is over"""
+        wait = self._throttled_until.get(backend, 0.0) - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Backoff delay for a retry: Retry-After when the server sent one, else 2^attempt + jitter"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self._MAX_RETRY_DELAY)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                return min(max(wait, 0.0), self._MAX_RETRY_DELAY)
+            except (TypeError, ValueError):
+                pass
+
+        return min(2 ** attempt + random.random(), self._MAX_RETRY_DELAY)
+
+    async def _iter_json_items(self, response, prefix: str = "item") -> AsyncIterator[Any]:
+        """
+        Yield objects from a JSON array in the response body as they are parsed.
+        prefix follows ijson syntax: "item" for a top-level list,
+        "messages.item" for the list under the "messages" key.
+        """
+        if ijson is not None:
+            async for obj in ijson.items(response.content, prefix, use_float=True):
+                yield obj
+            return
+
+        # No ijson available - buffer the whole body and walk to the same list
+        data = await _read_json(response)
+        for key in prefix.split(".")[:-1]:
+            data = data.get(key, []) if isinstance(data, dict) else []
+        for obj in data:
+            yield obj
+
     def _get_todoist_tools(self) -> List[Dict[str, Any]]:
         """Define Todoist tools for Claude"""
         return [
@@ -288,7 +1194,8 @@ class MCPClient:
                 "input_schema": {
                     "type": "object",
                     "properties": {
-                        "message_id": {"type": "string", "description": "Email message ID from search results"}
+                        "message_id": {"type": "string", "description": "Email message ID from search results"},
+                        "body_only": {"type": "boolean", "description": "Fetch the raw message and parse it locally; finds plain-text bodies nested in multipart messages"}
                     },
                     "required": ["message_id"]
                 }
@@ -388,7 +1295,7 @@ class MCPClient:
                     "type": "object",
                     "properties": {
                         "message_id": {"type": "string", "description": "Email message ID"},
-                        "label_id": {"type": "string", "description": "Label ID to add"}
+                        "label_id": {"type": "string", "description": "Label ID or name to add"}
                     },
                     "required": ["message_id", "label_id"]
                 }
@@ -400,10 +1307,23 @@ class MCPClient:
                     "type": "object",
                     "properties": {
                         "message_id": {"type": "string", "description": "Email message ID"},
-                        "label_id": {"type": "string", "description": "Label ID to remove"}
+                        "label_id": {"type": "string", "description": "Label ID or name to remove"}
                     },
                     "required": ["message_id", "label_id"]
                 }
+            },
+            {
+                "name": "gmail_modify_labels",
+                "description": "Add and/or remove labels on one or more emails in a single request (e.g. mark read and archive: remove UNREAD and INBOX)",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "message_ids": {"type": "array", "items": {"type": "string"}, "description": "Email message IDs"},
+                        "add_labels": {"type": "array", "items": {"type": "string"}, "description": "Label IDs or names to add"},
+                        "remove_labels": {"type": "array", "items": {"type": "string"}, "description": "Label IDs or names to remove"}
+                    },
+                    "required": ["message_ids"]
+                }
             }
         ]
 
@@ -616,6 +1536,29 @@ class MCPClient:
                     "required": ["message_id", "attachment_id", "filename"]
                 }
             },
+            {
+                "name": "gmail_download_attachments",
+                "description": "Download several attachments of one email in parallel. Prefer this over repeated gmail_download_attachment calls",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "message_id": {"type": "string", "description": "Email message ID"},
+                        "attachments": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "attachment_id": {"type": "string", "description": "Attachment ID"},
+                                    "filename": {"type": "string", "description": "Save as filename"}
+                                },
+                                "required": ["attachment_id", "filename"]
+                            },
+                            "description": "Attachments to download"
+                        }
+                    },
+                    "required": ["message_id", "attachments"]
+                }
+            },
             {
                 "name": "gmail_create_draft",
                 "description": "Create an email draft",
@@ -919,6 +1862,31 @@ class MCPClient:
                     "required": ["origin", "destination"]
                 }
             },
+            {
+                "name": "google_maps_get_directions_batch",
+                "description": "Get several routes at once (e.g. there and back, or driving vs transit). Prefer this over repeated google_maps_get_directions calls",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "routes": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "origin": {"type": "string", "description": "Starting location"},
+                                    "destination": {"type": "string", "description": "Destination location"},
+                                    "mode": {"type": "string", "enum": ["driving", "walking", "bicycling", "transit"]},
+                                    "departure_time": {"type": "string", "description": "Departure time for transit (ISO format or 'now')"},
+                                    "alternatives": {"type": "boolean"}
+                                },
+                                "required": ["origin", "destination"]
+                            },
+                            "description": "Routes to look up, same fields as google_maps_get_directions"
+                        }
+                    },
+                    "required": ["routes"]
+                }
+            },
             {
                 "name": "google_maps_get_place_details",
                 "description": "Get detailed information about a specific place (hours, phone, website, reviews, etc.)",
@@ -974,6 +1942,31 @@ class MCPClient:
                     "required": ["query"]
                 }
             },
+            {
+                "name": "google_web_search_batch",
+                "description": "Run several web searches at once. Prefer this over repeated google_web_search calls",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "searches": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "query": {"type": "string", "description": "Search query"},
+                                    "num_results": {"type": "integer"},
+                                    "search_type": {"type": "string", "enum": ["web", "image"]},
+                                    "site": {"type": "string"},
+                                    "date_restrict": {"type": "string"}
+                                },
+                                "required": ["query"]
+                            },
+                            "description": "Searches to run, same fields as google_web_search"
+                        }
+                    },
+                    "required": ["searches"]
+                }
+            },
             {
                 "name": "fetch_webpage",
                 "description": "Fetch and read the full text content from any URL. Fast and lightweight - use for static websites, articles, documentation. Returns the main content as clean text.",
@@ -1018,8 +2011,59 @@ class MCPClient:
 
     async def execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool call via MCP"""
-        logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
+        logger.info("Executing tool: %s with input: %s", tool_name, tool_input)
+
+        validator = self._validators.get(tool_name)
+        if validator:
+            try:
+                validator(tool_input)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {"error": f"Invalid input for {tool_name}: {e.message}"}
+
+        if tool_name in self._CACHEABLE_TOOLS:
+            # Google results differ per account, so the account is part of the key
+            key = (
+                tool_name,
+                getattr(self, "active_account", "personal"),
+                _dump_json(tool_input, sort_keys=True)
+            )
+            return await self._cached_call(
+                key,
+                lambda: self._dispatch_tool(tool_name, tool_input),
+                ttl=self._RESULT_CACHE_TTLS.get(tool_name)
+            )
 
+        result = await self._dispatch_tool(tool_name, tool_input)
+
+        for stale_tool in self._CACHE_INVALIDATIONS.get(tool_name, ()):
+            self._invalidate_cached(stale_tool)
+
+        return result
+
+    async def _cached_call(self, key: tuple, coro_factory, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Return a fresh cached result for key, or await coro_factory() and cache a success"""
+        ttl = self._RESULT_CACHE_TTL if ttl is None else ttl
+        cached = self._result_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            self._result_cache.move_to_end(key)
+            logger.debug(f"Result cache hit: {key[0]}")
+            return cached[1]
+
+        result = await coro_factory()
+        if result.get("success"):
+            self._result_cache[key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self._RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _invalidate_cached(self, tool_name: str):
+        """Drop every cached result for tool_name (all accounts and inputs)"""
+        for key in [k for k in self._result_cache if k[0] == tool_name]:
+            del self._result_cache[key]
+
+    async def _dispatch_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Route a validated tool call to its handler"""
         try:
             if tool_name == "todoist_get_tasks":
                 return await self._todoist_get_tasks(tool_input)
@@ -1038,7 +2082,7 @@ class MCPClient:
             elif tool_name == "gmail_send":
                 return await self._gmail_send(tool_input)
             elif tool_name == "gmail_read":
-                return await self._gmail_read(tool_input.get("message_id"))
+                return await self._gmail_read(tool_input.get("message_id"), tool_input.get("body_only", False))
             elif tool_name == "gmail_reply":
                 return await self._gmail_reply(tool_input)
             elif tool_name == "gmail_delete":
@@ -1059,6 +2103,8 @@ class MCPClient:
                 return await self._gmail_add_label(tool_input)
             elif tool_name == "gmail_remove_label":
                 return await self._gmail_remove_label(tool_input)
+            elif tool_name == "gmail_modify_labels":
+                return await self._gmail_modify_labels(tool_input)
             elif tool_name == "calendar_list_events":
                 return await self._calendar_list_events(tool_input)
             elif tool_name == "calendar_create_event":
@@ -1095,6 +2141,8 @@ class MCPClient:
                 return await self._gmail_send_advanced(tool_input)
             elif tool_name == "gmail_download_attachment":
                 return await self._gmail_download_attachment(tool_input)
+            elif tool_name == "gmail_download_attachments":
+                return await self._gmail_download_attachments(tool_input)
             elif tool_name == "gmail_create_draft":
                 return await self._gmail_create_draft(tool_input)
             elif tool_name == "gmail_list_drafts":
@@ -1147,12 +2195,16 @@ class MCPClient:
                 return await self._google_maps_search_places(tool_input)
             elif tool_name == "google_maps_get_directions":
                 return await self._google_maps_get_directions(tool_input)
+            elif tool_name == "google_maps_get_directions_batch":
+                return await self._run_batch(self._google_maps_get_directions, tool_input["routes"])
             elif tool_name == "google_maps_get_place_details":
                 return await self._google_maps_get_place_details(tool_input)
 
             # Web search tools
             elif tool_name == "google_web_search":
                 return await self._google_web_search(tool_input)
+            elif tool_name == "google_web_search_batch":
+                return await self._run_batch(self._google_web_search, tool_input["searches"])
             elif tool_name == "fetch_webpage":
                 return await self._fetch_webpage(tool_input)
             elif tool_name == "fetch_webpage_browser":
@@ -1160,526 +2212,552 @@ class MCPClient:
 
             else:
                 return {"error": f"Unknown tool: {tool_name}"}
+        except BotError as e:
+            # Raised by our own layers (e.g. an open circuit breaker), already user-presentable
+            logger.warning("Tool %s failed: %s", tool_name, e)
+            return {"success": False, "error": e.user_message}
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {str(e)}", exc_info=True)
-            return {"error": str(e)}
+            logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
+            return {"error": str(e)[:_MAX_ERROR_TEXT]}
 
     async def _todoist_get_tasks(self, filter_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get tasks from Todoist API with comprehensive filtering"""
-        import aiohttp
-
         url = "https://api.todoist.com/rest/v2/tasks"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        # Build query parameters from filter options
+        # Build query parameters from filter options (filter query syntax,
+        # project/label ids and priority 1-4 map directly onto the API)
         params = {}
 
         if filter_params:
-            # Support Todoist filter query syntax
-            if "filter" in filter_params:
-                params["filter"] = filter_params["filter"]
+            params.update((k, filter_params[k]) for k in self._TODOIST_FILTER_KEYS if k in filter_params)
 
-            # Support direct API parameters
-            if "project_id" in filter_params:
-                params["project_id"] = filter_params["project_id"]
-
-            if "label" in filter_params:
-                params["label"] = filter_params["label"]
-
-            if "priority" in filter_params:
-                # Todoist API expects priority 1-4
-                params["priority"] = filter_params["priority"]
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
-                    tasks = await response.json()
-                    return {
-                        "success": True,
-                        "tasks": tasks,
-                        "count": len(tasks)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        async with self._stream_get("todoist", url, headers=headers, params=params) as response:
+            if response.status == 200:
+                tasks = [task async for task in self._iter_json_items(response)]
+                return {
+                    "success": True,
+                    "tasks": tasks,
+                    "count": len(tasks)
+                }
+            else:
+                return await _api_error("Todoist", response)
 
     async def _todoist_create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a task in Todoist"""
-        import aiohttp
-
         url = "https://api.todoist.com/rest/v2/tasks"
-        headers = {
-            "Authorization": f"Bearer {self.todoist_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._todoist_headers_json
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=task_data) as response:
-                if response.status in [200, 201]:
-                    task = await response.json()
-                    return {
-                        "success": True,
-                        "task": task,
-                        "message": f"Created task: {task['content']}"
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        response = await self._request("POST", url, headers=headers, data=_dump_json(task_data))
+        if response.status in [200, 201]:
+            task = await _read_json(response)
+            return {
+                "success": True,
+                "task": task,
+                "message": f"Created task: {task['content']}"
+            }
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_complete_task(self, task_id: str) -> Dict[str, Any]:
         """Complete a task in Todoist"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/tasks/{task_id}/close"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers) as response:
-                if response.status == 204:
-                    return {
-                        "success": True,
-                        "message": f"Task {task_id} marked as complete"
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        response = await self._request("POST", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return {
+                "success": True,
+                "message": f"Task {task_id} marked as complete"
+            }
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_update_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update a task in Todoist"""
-        import aiohttp
-
         task_id = task_data.get("task_id")
         url = f"https://api.todoist.com/rest/v2/tasks/{task_id}"
-        headers = {
-            "Authorization": f"Bearer {self.todoist_token}",
-            "Content-Type": "application/json"
-        }
+        headers = self._todoist_headers_json
 
         # Build update payload
-        update_data = {}
-        if "content" in task_data:
-            update_data["content"] = task_data["content"]
-        if "description" in task_data:
-            update_data["description"] = task_data["description"]
-        if "due_string" in task_data:
-            update_data["due_string"] = task_data["due_string"]
-        if "priority" in task_data:
-            update_data["priority"] = task_data["priority"]
-        if "labels" in task_data:
-            update_data["labels"] = task_data["labels"]
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=update_data) as response:
-                if response.status == 200:
-                    task = await response.json()
-                    return {
-                        "success": True,
-                        "task": task,
-                        "message": f"Updated task: {task['content']}"
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        update_data = {k: task_data[k] for k in self._TODOIST_TASK_UPDATE_KEYS if k in task_data}
+
+        response = await self._request("POST", url, headers=headers, data=_dump_json(update_data))
+        if response.status == 200:
+            task = await _read_json(response)
+            return {
+                "success": True,
+                "task": task,
+                "message": f"Updated task: {task['content']}"
+            }
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_delete_task(self, task_id: str) -> Dict[str, Any]:
         """Delete a task from Todoist"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/tasks/{task_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {
-                        "success": True,
-                        "message": f"Task {task_id} deleted"
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return {
+                "success": True,
+                "message": f"Task {task_id} deleted"
+            }
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_list_projects(self) -> Dict[str, Any]:
         """List all projects in Todoist"""
-        import aiohttp
-
         url = "https://api.todoist.com/rest/v2/projects"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    projects = await response.json()
-                    return {
-                        "success": True,
-                        "projects": projects,
-                        "count": len(projects)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {
-                        "success": False,
-                        "error": f"Todoist API error: {response.status} - {error_text}"
-                    }
+        response = await self._request("GET", url, headers=headers)
+        if response.status == 200:
+            projects = await _read_json(response)
+            return {
+                "success": True,
+                "projects": projects,
+                "count": len(projects)
+            }
+        else:
+            return await _api_error("Todoist", response)
 
     async def _gmail_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search Gmail using Google Gmail API"""
-        import aiohttp
-        from datetime import datetime
-
         query = params.get("query", "")
         max_results = params.get("max_results", 10)
 
         url = "https://gmail.googleapis.com/gmail/v1/users/me/messages"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         params_dict = {
             "q": query,
-            "maxResults": min(max_results, 20)
+            "maxResults": min(max_results, 20),
+            "fields": "messages/id"
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Search for messages
-                async with session.get(url, headers=headers, params=params_dict) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
-
-                    data = await response.json()
-                    messages = data.get("messages", [])
-
-                    if not messages:
-                        return {"success": True, "emails": [], "count": 0, "message": "No emails found"}
-
-                    # Fetch details for each message
-                    email_details = []
-                    for msg in messages[:max_results]:
-                        msg_url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{msg['id']}"
-                        async with session.get(msg_url, headers=headers) as msg_response:
-                            if msg_response.status == 200:
-                                msg_data = await msg_response.json()
-
-                                # Extract headers
-                                headers_data = msg_data.get("payload", {}).get("headers", [])
-                                subject = next((h["value"] for h in headers_data if h["name"] == "Subject"), "No Subject")
-                                from_email = next((h["value"] for h in headers_data if h["name"] == "From"), "Unknown")
-                                date = next((h["value"] for h in headers_data if h["name"] == "Date"), "Unknown")
-
-                                # Get snippet
-                                snippet = msg_data.get("snippet", "")
-
-                                email_details.append({
-                                    "id": msg["id"],
-                                    "subject": subject,
-                                    "from": from_email,
-                                    "date": date,
-                                    "snippet": snippet[:200]  # First 200 chars
-                                })
+            # Search for messages
+            response = await self._request("GET", url, headers=headers, params=params_dict)
+            if response.status != 200:
+                return await _api_error("Gmail", response)
+
+            data = await _read_json(response)
+            messages = data.get("messages", [])
+
+            if not messages:
+                return {"success": True, "emails": [], "count": 0, "message": "No emails found"}
+
+            # Fetch details for all messages in a single batch round trip
+            message_ids = [msg["id"] for msg in messages[:max_results]]
+            email_details = []
+            for msg_data in await self._gmail_batch_get(message_ids, headers):
+                # Extract headers
+                header_map = _extract_headers(msg_data.get("payload", {}))
+                subject = header_map.get("Subject", "No Subject")
+                from_email = header_map.get("From", "Unknown")
+                date = header_map.get("Date", "Unknown")
+
+                # Get snippet
+                snippet = msg_data.get("snippet", "")
+
+                email_details.append({
+                    "id": msg_data["id"],
+                    "subject": subject,
+                    "from": from_email,
+                    "date": date,
+                    "snippet": snippet  # Gmail caps snippets at ~200 chars
+                })
 
-                    return {
-                        "success": True,
-                        "emails": email_details,
-                        "count": len(email_details)
-                    }
+            return {
+                "success": True,
+                "emails": email_details,
+                "count": len(email_details)
+            }
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _gmail_send(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Send email via Gmail API"""
-        import aiohttp
-        import base64
-        from email.mime.text import MIMEText
-
-        to = params.get("to")
+    async def _gmail_batch_get(
+        self,
+        message_ids: List[str],
+        headers: Mapping[str, str],
+        query: str = _GMAIL_METADATA_QUERY
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several Gmail messages through the batch endpoint, 100 per request.
+        Falls back to concurrent single GETs (at most 10 in flight) if a batch
+        request fails. Messages that could not be fetched are skipped; order
+        follows message_ids.
+        """
+        results = []
+        semaphore = asyncio.Semaphore(10)
+        for start in range(0, len(message_ids), 100):
+            chunk = message_ids[start:start + 100]
+            fetched = await self._gmail_batch_chunk(chunk, headers, query)
+            if fetched is None:
+                fetched = await asyncio.gather(
+                    *(self._gmail_get_message(msg_id, headers, query, semaphore) for msg_id in chunk)
+                )
+            results.extend(msg for msg in fetched if msg)
+        return results
+
+    async def _gmail_batch_chunk(
+        self,
+        message_ids: List[str],
+        headers: Mapping[str, str],
+        query: str
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Send one multipart/mixed batch request; returns None if the batch call itself failed"""
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for index, msg_id in enumerate(message_ids):
+            parts.append(
+                f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <item-{index}>\r\n\r\n"
+                f"GET /gmail/v1/users/me/messages/{msg_id}?{query}\r\n\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+
+        batch_headers = {**headers, "Content-Type": f"multipart/mixed; boundary={boundary}"}
+        try:
+            response = await self._request(
+                "POST",
+                "https://gmail.googleapis.com/batch/gmail/v1",
+                headers=batch_headers,
+                data="".join(parts).encode()
+            )
+            if response.status != 200:
+                logger.warning(f"Gmail batch request failed ({response.status}), falling back to single GETs")
+                return None
+            content_type = response.headers.get("Content-Type", "")
+            raw = await response.read()
+        except BotError:
+            raise  # Open breaker: single GETs would be rejected too
+        except Exception as e:
+            logger.warning(f"Gmail batch request failed ({str(e)}), falling back to single GETs")
+            return None
+
+        return _parse_gmail_batch(raw, content_type, len(message_ids))
+
+    async def _gmail_get_message(
+        self,
+        message_id: str,
+        headers: Mapping[str, str],
+        query: str,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single Gmail message, returning None on failure"""
+        url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}?{query}"
+        async with semaphore:
+            try:
+                response = await self._request("GET", url, headers=headers)
+                if response.status == 200:
+                    return await _read_json(response)
+            except BotError:
+                raise
+            except Exception as e:
+                logger.warning(f"Could not fetch Gmail message {message_id}: {str(e)}")
+        return None
+
+    async def _gmail_send(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send email via Gmail API"""
+        to = params.get("to")
         subject = params.get("subject")
         body = params.get("body")
 
         try:
-            # Create email message
-            message = MIMEText(body)
-            message['to'] = to
-            message['subject'] = subject
-            message['from'] = self.google_user_email
-
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+            # Create and encode email message
+            message = _build_raw_message(to, subject, body, self.google_user_email)
+            raw_message = fast_b64.urlsafe_b64encode(message).decode("ascii")
 
             url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
-            headers = {
-                "Authorization": f"Bearer {self._get_active_google_token()}",
-                "Content-Type": "application/json"
-            }
+            headers = self._google_headers(json_body=True)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json={"raw": raw_message}) as response:
-                    if response.status in [200, 201]:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "message_id": data.get("id"),
-                            "message": f"Email sent to {to}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request("POST", url, headers=headers, data=_dump_json({"raw": raw_message}))
+            if response.status in [200, 201]:
+                data = await _read_json(response)
+                return {
+                    "success": True,
+                    "message_id": data.get("id"),
+                    "message": f"Email sent to {to}"
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _gmail_read(self, message_id: str) -> Dict[str, Any]:
+    async def _gmail_read(self, message_id: str, body_only: bool = False) -> Dict[str, Any]:
         """Read full email content"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
+
+        if body_only:
+            return await self._gmail_read_raw(message_id, url, headers)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        msg_data = await response.json()
-
-                        # Extract headers
-                        headers_data = msg_data.get("payload", {}).get("headers", [])
-                        subject = next((h["value"] for h in headers_data if h["name"] == "Subject"), "No Subject")
-                        from_email = next((h["value"] for h in headers_data if h["name"] == "From"), "Unknown")
-                        date = next((h["value"] for h in headers_data if h["name"] == "Date"), "Unknown")
-
-                        # Get body
-                        payload = msg_data.get("payload", {})
-                        body = ""
-
-                        if "parts" in payload:
-                            for part in payload["parts"]:
-                                if part.get("mimeType") == "text/plain":
-                                    body_data = part.get("body", {}).get("data", "")
-                                    if body_data:
-                                        import base64
-                                        body = base64.urlsafe_b64decode(body_data).decode('utf-8', errors='ignore')
-                                        break
-                        else:
-                            body_data = payload.get("body", {}).get("data", "")
+            response = await self._request(
+                "GET", url, headers=headers,
+                params={"fields": "payload(headers,mimeType,body/data,parts(mimeType,body/data))"}
+            )
+            if response.status == 200:
+                msg_data = await _read_json(response)
+
+                # Extract headers
+                header_map = _extract_headers(msg_data.get("payload", {}))
+                subject = header_map.get("Subject", "No Subject")
+                from_email = header_map.get("From", "Unknown")
+                date = header_map.get("Date", "Unknown")
+
+                # Get body
+                payload = msg_data.get("payload", {})
+                body = ""
+
+                if "parts" in payload:
+                    for part in payload["parts"]:
+                        if part.get("mimeType") == "text/plain":
+                            body_data = part.get("body", {}).get("data", "")
                             if body_data:
-                                import base64
-                                body = base64.urlsafe_b64decode(body_data).decode('utf-8', errors='ignore')
-
-                        return {
-                            "success": True,
-                            "id": message_id,
-                            "subject": subject,
-                            "from": from_email,
-                            "date": date,
-                            "body": body[:5000]  # Limit to first 5000 chars
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+                                body = _decode_body_prefix(body_data)
+                                break
+                else:
+                    body_data = payload.get("body", {}).get("data", "")
+                    if body_data:
+                        body = _decode_body_prefix(body_data)
+
+                return {
+                    "success": True,
+                    "id": message_id,
+                    "subject": subject,
+                    "from": from_email,
+                    "date": date,
+                    "body": body  # Already capped at 5000 chars by _decode_body_prefix
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def _gmail_read_raw(self, message_id: str, url: str, headers: Mapping[str, str]) -> Dict[str, Any]:
+        """Read an email via format=raw, letting the email package pick the body part"""
+        try:
+            response = await self._request(
+                "GET", f"{url}?format=raw&fields=raw", headers=headers
+            )
+            if response.status == 200:
+                msg_data = await _read_json(response)
+                raw = fast_b64.urlsafe_b64decode(msg_data.get("raw", ""))
+                parsed = BytesParser(policy=policy.default).parsebytes(raw)
+
+                body_part = parsed.get_body(preferencelist=("plain",))
+                body = body_part.get_content() if body_part is not None else ""
+
+                return {
+                    "success": True,
+                    "id": message_id,
+                    "subject": str(parsed.get("Subject", "No Subject")),
+                    "from": str(parsed.get("From", "Unknown")),
+                    "date": str(parsed.get("Date", "Unknown")),
+                    "body": body[:5000]  # Limit to first 5000 chars
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_reply(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Reply to an email with threading"""
-        import aiohttp
-        import base64
-        from email.mime.text import MIMEText
-
         message_id = params.get("message_id")
         reply_body = params.get("body")
 
         try:
             # First get the original message to extract thread_id and headers
             get_url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}"
-            headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(get_url, headers=headers) as get_response:
-                    if get_response.status == 200:
-                        orig_msg = await get_response.json()
-                        thread_id = orig_msg.get("threadId")
-
-                        # Extract subject and recipient
-                        headers_data = orig_msg.get("payload", {}).get("headers", [])
-                        orig_subject = next((h["value"] for h in headers_data if h["name"] == "Subject"), "")
-                        orig_from = next((h["value"] for h in headers_data if h["name"] == "From"), "")
-
-                        # Extract email from "Name <email>" format
-                        if "<" in orig_from:
-                            to_email = orig_from.split("<")[1].strip(">")
-                        else:
-                            to_email = orig_from
-
-                        # Create reply
-                        reply = MIMEText(reply_body)
-                        reply['to'] = to_email
-                        reply['subject'] = f"Re: {orig_subject}" if not orig_subject.startswith("Re:") else orig_subject
-                        reply['from'] = self.google_user_email
-                        reply['In-Reply-To'] = message_id
-                        reply['References'] = message_id
-
-                        raw_reply = base64.urlsafe_b64encode(reply.as_bytes()).decode()
-
-                        send_url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
-                        send_headers = {
-                            "Authorization": f"Bearer {self._get_active_google_token()}",
-                            "Content-Type": "application/json"
-                        }
+            headers = self._google_headers()
+
+            get_response = await self._request(
+                "GET", get_url, headers=headers,
+                params=[
+                    ("format", "metadata"),
+                    ("metadataHeaders", "Subject"),
+                    ("metadataHeaders", "From"),
+                    ("fields", "threadId,payload/headers"),
+                ]
+            )
+            if get_response.status == 200:
+                orig_msg = await _read_json(get_response)
+                thread_id = orig_msg.get("threadId")
+
+                # Extract subject and recipient
+                header_map = _extract_headers(orig_msg.get("payload", {}))
+                orig_subject = header_map.get("Subject", "")
+                orig_from = header_map.get("From", "")
+
+                # Extract email from "Name <email>" format
+                match = _ADDR_RE.search(orig_from)
+                to_email = match.group(1) if match else orig_from.strip()
+
+                # Create reply
+                reply_subject = orig_subject if orig_subject[:3].lower() == "re:" else f"Re: {orig_subject}"
+                reply = _build_raw_message(
+                    to_email, reply_subject, reply_body, self.google_user_email, in_reply_to=message_id
+                )
+                raw_reply = fast_b64.urlsafe_b64encode(reply).decode("ascii")
+
+                send_url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
+                send_headers = self._google_headers(json_body=True)
 
-                        async with session.post(send_url, headers=send_headers, json={"raw": raw_reply, "threadId": thread_id}) as response:
-                            if response.status in [200, 201]:
-                                data = await response.json()
-                                return {
-                                    "success": True,
-                                    "message_id": data.get("id"),
-                                    "message": f"Reply sent to {to_email}"
-                                }
-                            else:
-                                error_text = await response.text()
-                                return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
-                    else:
-                        error_text = await get_response.text()
-                        return {"success": False, "error": f"Could not fetch original message: {get_response.status} - {error_text}"}
+                response = await self._request("POST", send_url, headers=send_headers, data=_dump_json({"raw": raw_reply, "threadId": thread_id}))
+                if response.status in [200, 201]:
+                    data = await _read_json(response)
+                    return {
+                        "success": True,
+                        "message_id": data.get("id"),
+                        "message": f"Reply sent to {to_email}"
+                    }
+                else:
+                    return await _api_error("Gmail", response)
+            else:
+                error_text = await _error_text(get_response)
+                return {"success": False, "error": f"Could not fetch original message: {get_response.status} - {error_text}"}
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_delete(self, message_id: str) -> Dict[str, Any]:
         """Move email to trash"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/trash"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "message": f"Email {message_id} moved to trash"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request("POST", url, headers=headers, read_body=False)
+            if response.status == 200:
+                return {
+                    "success": True,
+                    "message": f"Email {message_id} moved to trash"
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_archive(self, message_id: str) -> Dict[str, Any]:
         """Archive email (remove from inbox)"""
-        import aiohttp
-
-        url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/modify"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
+        result = await self._gmail_modify([message_id], remove=["INBOX"])
+        if not result["success"]:
+            return result
+        return {
+            "success": True,
+            "message": f"Email {message_id} archived"
         }
-        body = {"removeLabelIds": ["INBOX"]}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "message": f"Email {message_id} archived"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
 
     async def _gmail_mark_read(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Mark email as read or unread"""
-        import aiohttp
-
         message_id = params.get("message_id")
         mark_read = params.get("read", True)
 
-        url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/modify"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
-
         if mark_read:
-            body = {"removeLabelIds": ["UNREAD"]}
+            result = await self._gmail_modify([message_id], remove=["UNREAD"])
         else:
-            body = {"addLabelIds": ["UNREAD"]}
+            result = await self._gmail_modify([message_id], add=["UNREAD"])
+        if not result["success"]:
+            return result
+
+        status = "read" if mark_read else "unread"
+        return {
+            "success": True,
+            "message": f"Email {message_id} marked as {status}"
+        }
 
+    async def _gmail_list_labels(self) -> Dict[str, Any]:
+        """List all Gmail labels"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        status = "read" if mark_read else "unread"
-                        return {
-                            "success": True,
-                            "message": f"Email {message_id} marked as {status}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            labels, error = await self._gmail_fetch_labels()
+            if error:
+                return {"success": False, "error": error}
+
+            # Format label info
+            formatted_labels = []
+            for label in labels:
+                formatted_labels.append({
+                    "id": label.get("id"),
+                    "name": label.get("name"),
+                    "type": label.get("type"),
+                    "messages_total": label.get("messagesTotal", 0),
+                    "messages_unread": label.get("messagesUnread", 0)
+                })
+
+            return {
+                "success": True,
+                "labels": formatted_labels,
+                "count": len(formatted_labels)
+            }
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    async def _gmail_list_labels(self) -> Dict[str, Any]:
-        """List all Gmail labels"""
-        import aiohttp
+    async def _gmail_fetch_labels(self):
+        """
+        Return (labels, error) for the active account, served from a short-lived
+        cache so label-by-name lookups don't each cost a round trip
+        """
+        account = getattr(self, "active_account", "personal")
+        cached = self._label_cache.get(account)
+        if cached and time.monotonic() - cached[0] < self._LABEL_CACHE_TTL:
+            return cached[1], None
 
         url = "https://gmail.googleapis.com/gmail/v1/users/me/labels"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        labels = data.get("labels", [])
-
-                        # Format label info
-                        formatted_labels = []
-                        for label in labels:
-                            formatted_labels.append({
-                                "id": label.get("id"),
-                                "name": label.get("name"),
-                                "type": label.get("type"),
-                                "messages_total": label.get("messagesTotal", 0),
-                                "messages_unread": label.get("messagesUnread", 0)
-                            })
-
-                        return {
-                            "success": True,
-                            "labels": formatted_labels,
-                            "count": len(formatted_labels)
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        headers = self._google_headers()
+
+        response = await self._request(
+            "GET", url, headers=headers,
+            params={"fields": "labels(id,name,type,messagesTotal,messagesUnread)"}
+        )
+        if response.status != 200:
+            error_text = await _error_text(response)
+            return None, f"Gmail API error: {response.status} - {error_text}"
+
+        data = await _read_json(response)
+        labels = data.get("labels", [])
+        self._label_cache[account] = (time.monotonic(), labels)
+        return labels, None
+
+    def _invalidate_label_cache(self):
+        """Forget the cached labels of the active account after a label write"""
+        self._label_cache.pop(getattr(self, "active_account", "personal"), None)
+
+    async def _resolve_label_id(self, name_or_id: str) -> str:
+        """Map a label name to its id using the cached label list; ids pass through unchanged"""
+        labels, _ = await self._gmail_fetch_labels()
+        if not labels:
+            return name_or_id
+
+        if any(label.get("id") == name_or_id for label in labels):
+            return name_or_id
+
+        wanted = name_or_id.lower()
+        for label in labels:
+            if (label.get("name") or "").lower() == wanted:
+                return label["id"]
+        return name_or_id
 
     async def _gmail_create_label(self, name: str) -> Dict[str, Any]:
         """Create a new Gmail label"""
-        import aiohttp
-
         url = "https://gmail.googleapis.com/gmail/v1/users/me/labels"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         body = {
             "name": name,
@@ -1688,225 +2766,281 @@ class MCPClient:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "label_id": data.get("id"),
-                            "label_name": data.get("name"),
-                            "message": f"Created label: {name}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request("POST", url, headers=headers, data=_dump_json(body))
+            if response.status == 200:
+                self._invalidate_label_cache()
+                data = await _read_json(response)
+                return {
+                    "success": True,
+                    "label_id": data.get("id"),
+                    "label_name": data.get("name"),
+                    "message": f"Created label: {name}"
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_delete_label(self, label_id: str) -> Dict[str, Any]:
         """Delete a Gmail label"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/labels/{label_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=headers) as response:
-                    if response.status == 204:
-                        return {
-                            "success": True,
-                            "message": f"Label {label_id} deleted"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request("DELETE", url, headers=headers, read_body=False)
+            if response.status in (200, 204):
+                self._invalidate_label_cache()
+                return {
+                    "success": True,
+                    "message": f"Label {label_id} deleted"
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_update_label(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update/rename a Gmail label"""
-        import aiohttp
-
         label_id = params.get("label_id")
         new_name = params.get("name")
 
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/labels/{label_id}"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         body = {"name": new_name}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "label_id": data.get("id"),
-                            "label_name": data.get("name"),
-                            "message": f"Label updated to: {new_name}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request("PATCH", url, headers=headers, data=_dump_json(body))
+            if response.status == 200:
+                self._invalidate_label_cache()
+                data = await _read_json(response)
+                return {
+                    "success": True,
+                    "label_id": data.get("id"),
+                    "label_name": data.get("name"),
+                    "message": f"Label updated to: {new_name}"
+                }
+            else:
+                return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _gmail_add_label(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a label to an email message"""
-        import aiohttp
-
         message_id = params.get("message_id")
-        label_id = params.get("label_id")
-
-        url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/modify"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
+        label_id = await self._resolve_label_id(params.get("label_id"))
+
+        result = await self._gmail_modify([message_id], add=[label_id])
+        if not result["success"]:
+            return result
+        return {
+            "success": True,
+            "message": f"Label {label_id} added to message {message_id}"
         }
 
-        body = {"addLabelIds": [label_id]}
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "message": f"Label {label_id} added to message {message_id}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
     async def _gmail_remove_label(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Remove a label from an email message"""
-        import aiohttp
-
         message_id = params.get("message_id")
-        label_id = params.get("label_id")
+        label_id = await self._resolve_label_id(params.get("label_id"))
+
+        result = await self._gmail_modify([message_id], remove=[label_id])
+        if not result["success"]:
+            return result
+        return {
+            "success": True,
+            "message": f"Label {label_id} removed from message {message_id}"
+        }
 
-        url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/modify"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
+    async def _gmail_modify_labels(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add/remove labels (IDs or names) on one or more messages in one request"""
+        message_ids = params.get("message_ids", [])
+        add = [await self._resolve_label_id(label) for label in params.get("add_labels", [])]
+        remove = [await self._resolve_label_id(label) for label in params.get("remove_labels", [])]
+
+        if not message_ids:
+            return {"success": False, "error": "No message_ids given"}
+        if not add and not remove:
+            return {"success": False, "error": "Nothing to change: pass add_labels and/or remove_labels"}
+
+        result = await self._gmail_modify(message_ids, add=add, remove=remove)
+        if not result["success"]:
+            return result
+        return {
+            "success": True,
+            "message": f"Updated labels on {len(message_ids)} message(s)",
+            "added": add,
+            "removed": remove
         }
 
-        body = {"removeLabelIds": [label_id]}
+    async def _gmail_modify(
+        self,
+        message_ids: List[str],
+        add: Optional[List[str]] = None,
+        remove: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Add/remove label ids in a single request: messages/{id}/modify for one
+        message, messages/batchModify (up to 1000 ids) for several
+        """
+        body = {}
+        if add:
+            body["addLabelIds"] = add
+        if remove:
+            body["removeLabelIds"] = remove
+
+        if len(message_ids) == 1:
+            url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_ids[0]}/modify"
+        else:
+            url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/batchModify"
+            body["ids"] = message_ids
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=body) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "message": f"Label {label_id} removed from message {message_id}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+            response = await self._request(
+                "POST", url, headers=self._google_headers(json_body=True),
+                data=_dump_json(body), read_body=False
+            )
+            if response.status in (200, 204):
+                return _SUCCESS
+            return await _api_error("Gmail", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _calendar_list_events(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List upcoming calendar events from owned calendars only (excludes holidays/sports)"""
-        import aiohttp
-        from datetime import datetime, timedelta
-
         days_ahead = params.get("days_ahead", 7)
         max_results = params.get("max_results", 50)  # Get more since we're filtering
 
-        # Get time range
-        now = datetime.utcnow()
-        time_min = now.isoformat() + "Z"
-        time_max = (now + timedelta(days=days_ahead)).isoformat() + "Z"
+        # Get time range (RFC 3339, UTC)
+        now = datetime.now(timezone.utc)
+        time_min = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        time_max = (now + timedelta(days=days_ahead)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # First, get list of calendars
-                calendar_list_url = "https://www.googleapis.com/calendar/v3/users/me/calendarList"
-                async with session.get(calendar_list_url, headers=headers) as cal_response:
-                    if cal_response.status != 200:
-                        error_text = await cal_response.text()
-                        return {"success": False, "error": f"Calendar list error: {cal_response.status} - {error_text}"}
-
-                    cal_data = await cal_response.json()
-
-                    # Filter to only owned calendars (not holidays/sports/read-only)
-                    owned_calendars = [
-                        cal for cal in cal_data.get("items", [])
-                        if cal.get("accessRole") in ["owner", "writer"]
-                        and "holiday@" not in cal.get("id", "")
-                        and "#sports@" not in cal.get("id", "")
-                    ]
-
-                    logger.info(f"Found {len(owned_calendars)} owned calendars")
-
-                # Collect events from all owned calendars
-                all_events = []
-                for calendar in owned_calendars:
-                    cal_id = calendar.get("id")
-                    cal_name = calendar.get("summary", "Unknown")
-
-                    events_url = f"https://www.googleapis.com/calendar/v3/calendars/{cal_id}/events"
-                    params_dict = {
-                        "timeMin": time_min,
-                        "timeMax": time_max,
-                        "maxResults": max_results,
-                        "singleEvents": "true",
-                        "orderBy": "startTime"
-                    }
-
-                    async with session.get(events_url, headers=headers, params=params_dict) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            events = data.get("items", [])
-
-                            for event in events:
-                                start = event.get("start", {}).get("dateTime", event.get("start", {}).get("date"))
-                                end = event.get("end", {}).get("dateTime", event.get("end", {}).get("date"))
-
-                                all_events.append({
-                                    "id": event.get("id"),
-                                    "summary": event.get("summary", "No Title"),
-                                    "start": start,
-                                    "end": end,
-                                    "calendar": cal_name,
-                                    "location": event.get("location", ""),
-                                    "description": event.get("description", "")[:200]
-                                })
+            # First, get list of calendars
+            owned_calendars, error = await self._calendar_owned_calendars(headers)
+            if error:
+                return {"success": False, "error": error}
+
+            # Collect events from all owned calendars concurrently
+            params_dict = {
+                "timeMin": time_min,
+                "timeMax": time_max,
+                "maxResults": max_results,
+                "singleEvents": "true",
+                "orderBy": "startTime",
+                "fields": "items(id,summary,start,end,location,description)"
+            }
+            semaphore = asyncio.Semaphore(10)  # Stay well under the Calendar per-second quota
+            per_calendar = await asyncio.gather(
+                *(self._calendar_fetch_events(calendar, headers, params_dict, semaphore)
+                  for calendar in owned_calendars),
+                return_exceptions=True
+            )
 
-                # Sort by start time
-                all_events.sort(key=lambda x: x["start"])
+            all_events = []
+            for calendar, events in zip(owned_calendars, per_calendar):
+                if isinstance(events, Exception):
+                    logger.warning(f"Could not list events for calendar {calendar.get('id')}: {str(events)}")
+                    continue
+                all_events.extend(events)
 
-                # Limit to requested max_results
-                limited_events = all_events[:params.get("max_results", 10)]
+            # Earliest max_results events by start time
+            limited_events = heapq.nsmallest(
+                params.get("max_results", 10), all_events, key=itemgetter("start")
+            )
 
-                if not limited_events:
-                    return {"success": True, "events": [], "count": 0, "message": "No upcoming events"}
+            if not limited_events:
+                return {"success": True, "events": [], "count": 0, "message": "No upcoming events"}
 
-                return {
-                    "success": True,
-                    "events": limited_events,
-                    "count": len(limited_events)
-                }
+            return {
+                "success": True,
+                "events": limited_events,
+                "count": len(limited_events)
+            }
+        except BotError:
+            raise
         except Exception as e:
             logger.error(f"Calendar list events error: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    async def _calendar_owned_calendars(self, headers: Mapping[str, str]):
+        """
+        Return (calendars, error): the writable calendars of the active account,
+        minus holiday/sports subscriptions, cached for a few minutes
+        """
+        account = getattr(self, "active_account", "personal")
+        cached = self._owned_calendar_cache.get(account)
+        if cached and time.monotonic() - cached[0] < self._OWNED_CALENDAR_CACHE_TTL:
+            return cached[1], None
+
+        calendar_list_url = "https://www.googleapis.com/calendar/v3/users/me/calendarList"
+        cal_response = await self._request(
+            "GET", calendar_list_url, headers=headers,
+            params={"fields": "items(id,summary,accessRole)"}
+        )
+        if cal_response.status != 200:
+            error_text = await _error_text(cal_response)
+            return None, f"Calendar list error: {cal_response.status} - {error_text}"
+
+        cal_data = await _read_json(cal_response)
+
+        # Filter to only owned calendars (not holidays/sports/read-only)
+        owned_calendars = [
+            cal for cal in cal_data.get("items", [])
+            if cal.get("accessRole") in ("owner", "writer")
+            and not _SKIP_CALENDAR_RE.search(cal.get("id", ""))
+        ]
+
+        logger.info(f"Found {len(owned_calendars)} owned calendars")
+        self._owned_calendar_cache[account] = (time.monotonic(), owned_calendars)
+        return owned_calendars, None
+
+    async def _calendar_fetch_events(
+        self,
+        calendar: Dict[str, Any],
+        headers: Mapping[str, str],
+        params_dict: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Fetch and format the events of one calendar for _calendar_list_events"""
+        cal_id = calendar.get("id")
+        cal_name = calendar.get("summary", "Unknown")
+        events_url = f"https://www.googleapis.com/calendar/v3/calendars/{cal_id}/events"
+
+        async with semaphore:
+            response = await self._request("GET", events_url, headers=headers, params=params_dict)
+            if response.status != 200:
+                return []
+            data = await _read_json(response)
+
+        formatted = []
+        for event in data.get("items", []):
+            start = event.get("start", {}).get("dateTime", event.get("start", {}).get("date"))
+            end = event.get("end", {}).get("dateTime", event.get("end", {}).get("date"))
+
+            formatted.append({
+                "id": event.get("id"),
+                "summary": event.get("summary", "No Title"),
+                "start": start,
+                "end": end,
+                "calendar": cal_name,
+                "location": event.get("location", ""),
+                "description": event.get("description", "")[:200]
+            })
+        return formatted
+
     async def _calendar_create_event(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new calendar event"""
-        import aiohttp
-
         summary = params.get("summary")
         start_time = params.get("start_time")
         end_time = params.get("end_time")
@@ -1920,32 +3054,27 @@ class MCPClient:
         }
 
         url = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=event_body) as response:
-                    if response.status in [200, 201]:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "event_id": data.get("id"),
-                            "html_link": data.get("htmlLink"),
-                            "message": f"Event '{summary}' created"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            response = await self._request("POST", url, headers=headers, data=_dump_json(event_body))
+            if response.status in [200, 201]:
+                data = await _read_json(response)
+                return {
+                    "success": True,
+                    "event_id": data.get("id"),
+                    "html_link": data.get("htmlLink"),
+                    "message": f"Event '{summary}' created"
+                }
+            else:
+                return await _api_error("Calendar", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _calendar_update_event(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing calendar event"""
-        import aiohttp
-
         event_id = params.get("event_id")
         calendar_id = params.get("calendar_id", "primary")
 
@@ -1964,151 +3093,216 @@ class MCPClient:
             update_body["location"] = params["location"]
 
         url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events/{event_id}"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(url, headers=headers, json=update_body) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "event_id": data.get("id"),
-                            "html_link": data.get("htmlLink"),
-                            "message": f"Event updated: {data.get('summary', 'Untitled')}"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            response = await self._request("PATCH", url, headers=headers, data=_dump_json(update_body))
+            if response.status == 200:
+                data = await _read_json(response)
+                return {
+                    "success": True,
+                    "event_id": data.get("id"),
+                    "html_link": data.get("htmlLink"),
+                    "message": f"Event updated: {data.get('summary', 'Untitled')}"
+                }
+            else:
+                return await _api_error("Calendar", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _calendar_delete_event(self, event_id: str, calendar_id: str = "primary") -> Dict[str, Any]:
         """Delete a calendar event"""
-        import aiohttp
-
         url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events/{event_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=headers) as response:
-                    if response.status == 204:
-                        return {
-                            "success": True,
-                            "message": f"Event {event_id} deleted"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            response = await self._request("DELETE", url, headers=headers, read_body=False)
+            if response.status in (200, 204):
+                return {
+                    "success": True,
+                    "message": f"Event {event_id} deleted"
+                }
+            else:
+                return await _api_error("Calendar", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     async def _calendar_list_calendars(self) -> Dict[str, Any]:
         """List all available calendars with details"""
-        import aiohttp
-
         url = "https://www.googleapis.com/calendar/v3/users/me/calendarList"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        calendars = []
-
-                        for cal in data.get("items", []):
-                            calendars.append({
-                                "id": cal.get("id"),
-                                "summary": cal.get("summary", "Untitled"),
-                                "description": cal.get("description", ""),
-                                "access_role": cal.get("accessRole"),
-                                "primary": cal.get("primary", False),
-                                "timezone": cal.get("timeZone", "")
-                            })
-
-                        return {
-                            "success": True,
-                            "calendars": calendars,
-                            "count": len(calendars)
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            response = await self._request(
+                "GET", url, headers=headers,
+                params={"fields": "items(id,summary,description,accessRole,primary,timeZone)"}
+            )
+            if response.status == 200:
+                data = await _read_json(response)
+                calendars = []
+
+                for cal in data.get("items", []):
+                    calendars.append({
+                        "id": cal.get("id"),
+                        "summary": cal.get("summary", "Untitled"),
+                        "description": cal.get("description", ""),
+                        "access_role": cal.get("accessRole"),
+                        "primary": cal.get("primary", False),
+                        "timezone": cal.get("timeZone", "")
+                    })
+
+                return {
+                    "success": True,
+                    "calendars": calendars,
+                    "count": len(calendars)
+                }
+            else:
+                return await _api_error("Calendar", response)
+        except BotError:
+            raise
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     # =================== NEW TODOIST METHODS ===================
 
+    async def _todoist_command(self, command_type: str, args: Dict[str, Any], temp_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Queue a Todoist Sync API command and wait for its result. Commands queued
+        within _TODOIST_BATCH_WINDOW go out together in one request, so several
+        Todoist writes from the same Claude turn cost a single round trip.
+        Returns {"success": True, "id": <created or target id>} or an error result.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        command = {"type": command_type, "uuid": str(uuid.uuid4()), "args": args}
+        if temp_id:
+            command["temp_id"] = temp_id
+        self._todoist_pending.append((command, future))
+
+        if len(self._todoist_pending) >= self._TODOIST_BATCH_MAX:
+            self._flush_todoist_commands()
+        elif self._todoist_flush_handle is None:
+            self._todoist_flush_handle = loop.call_later(self._TODOIST_BATCH_WINDOW, self._flush_todoist_commands)
+
+        return await future
+
+    def _flush_todoist_commands(self):
+        """Send every queued Todoist command in one background Sync request"""
+        if self._todoist_flush_handle is not None:
+            self._todoist_flush_handle.cancel()
+            self._todoist_flush_handle = None
+
+        batch, self._todoist_pending = self._todoist_pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send_todoist_commands(batch))
+            self._todoist_flushes.add(task)
+            task.add_done_callback(self._todoist_flushes.discard)
+
+    async def _send_todoist_commands(self, batch: List[tuple]):
+        """POST a batch of Sync commands and resolve each command's future"""
+        commands = [command for command, _ in batch]
+
+        try:
+            response = await self._request(
+                "POST", self._TODOIST_SYNC_URL,
+                headers=self._todoist_headers, data={"commands": _dump_json(commands).decode()}
+            )
+            if response.status == 200:
+                data = await _read_json(response)
+            else:
+                data = None
+                failure = await _api_error("Todoist", response)
+        except BotError as e:
+            data = None
+            failure = {"success": False, "error": e.user_message}
+        except Exception as e:
+            data = None
+            failure = {"success": False, "error": str(e)}
+
+        statuses = data.get("sync_status", {}) if data else {}
+        id_mapping = data.get("temp_id_mapping", {}) if data else {}
+        for command, future in batch:
+            if future.done():  # Caller was cancelled
+                continue
+            if data is None:
+                future.set_result(failure)
+                continue
+
+            status = statuses.get(command["uuid"])
+            if status == "ok":
+                new_id = id_mapping.get(command.get("temp_id"), command["args"].get("id"))
+                future.set_result({"success": True, "id": new_id})
+            elif status is None:
+                future.set_result({"success": False, "error": f"Todoist API error: no status for command {command['type']}"})
+            else:
+                error = status.get("error", status) if isinstance(status, dict) else status
+                future.set_result({"success": False, "error": f"Todoist API error: {error}"})
+
+    async def _todoist_read_back(self, resource: str, object_id: str, fallback: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch the server's copy of an object a Sync command just wrote; command
+        replies carry only ids. The write already succeeded, so if the read
+        fails the caller still gets fallback (the id and the fields it sent).
+        """
+        url = f"https://api.todoist.com/rest/v2/{resource}/{object_id}"
+        try:
+            response = await self._request("GET", url, headers=self._todoist_headers)
+            if response.status == 200:
+                return await _read_json(response)
+            logger.warning(f"Could not read back Todoist {resource} {object_id}: {response.status}")
+        except Exception as e:
+            logger.warning(f"Could not read back Todoist {resource} {object_id}: {str(e)}")
+        return fallback
+
     async def _todoist_list_labels(self) -> Dict[str, Any]:
         """List all Todoist labels"""
-        import aiohttp
-
         url = "https://api.todoist.com/rest/v2/labels"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    labels = await response.json()
-                    return {"success": True, "labels": labels, "count": len(labels)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("GET", url, headers=headers)
+        if response.status == 200:
+            labels = await _read_json(response)
+            return {"success": True, "labels": labels, "count": len(labels)}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_create_label(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new label"""
-        import aiohttp
-
         url = "https://api.todoist.com/rest/v2/labels"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
+        headers = self._todoist_headers_json
 
         payload = {"name": params["name"]}
         if "color" in params:
             payload["color"] = params["color"]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status in [200, 201]:
-                    label = await response.json()
-                    return {"success": True, "label": label}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(payload))
+        if response.status in [200, 201]:
+            label = await _read_json(response)
+            return {"success": True, "label": label}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_create_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new project"""
-        import aiohttp
-
-        url = "https://api.todoist.com/rest/v2/projects"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
-
         payload = {"name": params["name"]}
         if "color" in params:
             payload["color"] = params["color"]
         if "favorite" in params:
             payload["is_favorite"] = params["favorite"]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status in [200, 201]:
-                    project = await response.json()
-                    return {"success": True, "project": project}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        result = await self._todoist_command("project_add", payload, temp_id=str(uuid.uuid4()))
+        if not result["success"]:
+            return result
+        project = await self._todoist_read_back("projects", result["id"], {"id": result["id"], **payload})
+        return {"success": True, "project": project}
 
     async def _todoist_update_project(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update a project"""
-        import aiohttp
-
         project_id = params["project_id"]
-        url = f"https://api.todoist.com/rest/v2/projects/{project_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
 
         payload = {}
         if "name" in params:
@@ -2118,191 +3312,136 @@ class MCPClient:
         if "favorite" in params:
             payload["is_favorite"] = params["favorite"]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    project = await response.json()
-                    return {"success": True, "project": project}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        result = await self._todoist_command("project_update", {"id": project_id, **payload})
+        if not result["success"]:
+            return result
+        project = await self._todoist_read_back("projects", project_id, {"id": project_id, **payload})
+        return {"success": True, "project": project}
 
     async def _todoist_delete_project(self, project_id: str) -> Dict[str, Any]:
         """Delete a project"""
-        import aiohttp
-
-        url = f"https://api.todoist.com/rest/v2/projects/{project_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        result = await self._todoist_command("project_delete", {"id": project_id})
+        if not result["success"]:
+            return result
+        return _PROJECT_DELETED
 
     async def _todoist_list_sections(self, project_id: str) -> Dict[str, Any]:
         """List sections in a project"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/sections?project_id={project_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    sections = await response.json()
-                    return {"success": True, "sections": sections, "count": len(sections)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("GET", url, headers=headers)
+        if response.status == 200:
+            sections = await _read_json(response)
+            return {"success": True, "sections": sections, "count": len(sections)}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_create_section(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a section in a project"""
-        import aiohttp
-
-        url = "https://api.todoist.com/rest/v2/sections"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
-
         payload = {
             "name": params["name"],
             "project_id": params["project_id"]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status in [200, 201]:
-                    section = await response.json()
-                    return {"success": True, "section": section}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        result = await self._todoist_command("section_add", payload, temp_id=str(uuid.uuid4()))
+        if not result["success"]:
+            return result
+        section = await self._todoist_read_back("sections", result["id"], {"id": result["id"], **payload})
+        return {"success": True, "section": section}
 
     async def _todoist_add_comment(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add a comment to a task"""
-        import aiohttp
-
-        url = "https://api.todoist.com/rest/v2/comments"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
-
         payload = {
             "task_id": params["task_id"],
             "content": params["content"]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status in [200, 201]:
-                    comment = await response.json()
-                    return {"success": True, "comment": comment}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        # The Sync API calls task comments "notes" and tasks "items"
+        result = await self._todoist_command(
+            "note_add",
+            {"item_id": payload["task_id"], "content": payload["content"]},
+            temp_id=str(uuid.uuid4())
+        )
+        if not result["success"]:
+            return result
+        comment = await self._todoist_read_back("comments", result["id"], {"id": result["id"], **payload})
+        return {"success": True, "comment": comment}
 
     async def _todoist_list_comments(self, task_id: str) -> Dict[str, Any]:
         """List comments for a task"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/comments?task_id={task_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    comments = await response.json()
-                    return {"success": True, "comments": comments, "count": len(comments)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("GET", url, headers=headers)
+        if response.status == 200:
+            comments = await _read_json(response)
+            return {"success": True, "comments": comments, "count": len(comments)}
+        else:
+            return await _api_error("Todoist", response)
 
     # =================== NEW GMAIL METHODS ===================
 
     async def _gmail_send_advanced(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Send email with CC/BCC, HTML, and attachments"""
-        import aiohttp
-        import base64
-        from email.mime.text import MIMEText
-        from email.mime.multipart import MIMEMultipart
-        from email.mime.base import MIMEBase
-        from email import encoders
-        import os
-
-        # Create message
-        message = MIMEMultipart()
-        message["to"] = params["to"]
-        message["subject"] = params["subject"]
-
-        if params.get("cc"):
-            message["cc"] = params["cc"]
-        if params.get("bcc"):
-            message["bcc"] = params["bcc"]
-
-        # Add body
-        body_type = "html" if params.get("html") else "plain"
-        message.attach(MIMEText(params["body"], body_type))
-
-        # Add attachments if any
-        if params.get("attachment_paths"):
-            for file_path in params["attachment_paths"]:
-                if os.path.exists(file_path):
-                    with open(file_path, "rb") as f:
-                        part = MIMEBase("application", "octet-stream")
-                        part.set_payload(f.read())
-                    encoders.encode_base64(part)
-                    part.add_header("Content-Disposition", f"attachment; filename={os.path.basename(file_path)}")
-                    message.attach(part)
-
-        # Encode message
-        raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        # File reads and MIME encoding of attachments would stall the event loop
+        raw_message = await asyncio.to_thread(_build_advanced_message, params)
 
         url = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json={"raw": raw_message}) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return {"success": True, "message_id": result.get("id")}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json({"raw": raw_message}))
+        if response.status == 200:
+            result = await _read_json(response)
+            return {"success": True, "message_id": result.get("id")}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_download_attachment(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Download email attachment"""
-        import aiohttp
-        import base64
-
         message_id = params["message_id"]
         attachment_id = params["attachment_id"]
         filename = params["filename"]
 
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/messages/{message_id}/attachments/{attachment_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
+
+        # Streamed straight to disk rather than through _request, which buffers the body
+        async with self._stream_get("gmail", url, headers=headers) as response:
+            if response.status != 200:
+                return await _api_error("Gmail", response)
+
+            f = await asyncio.to_thread(open, filename, "wb")
+            try:
+                size = await _stream_b64_field(response.content.iter_chunked(65536), b"data", f)
+            except BaseException:
+                await asyncio.to_thread(f.close)
+                await asyncio.to_thread(os.remove, filename)
+                raise
+            await asyncio.to_thread(f.close)
+
+        return {"success": True, "filename": filename, "size": size}
+
+    async def _gmail_download_attachments(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Download several attachments of one message concurrently"""
+        message_id = params["message_id"]
+        semaphore = asyncio.Semaphore(6)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    file_data = base64.urlsafe_b64decode(data["data"])
+        async def _one(attachment: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self._gmail_download_attachment({"message_id": message_id, **attachment})
+                except BotError as e:
+                    return {"success": False, "filename": attachment.get("filename"), "error": e.user_message}
+                except Exception as e:
+                    return {"success": False, "filename": attachment.get("filename"), "error": str(e)[:_MAX_ERROR_TEXT]}
 
-                    with open(filename, "wb") as f:
-                        f.write(file_data)
-
-                    return {"success": True, "filename": filename, "size": len(file_data)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        results = await asyncio.gather(*[_one(a) for a in params["attachments"]])
+        downloaded = sum(1 for r in results if r.get("success"))
+        return {"success": downloaded == len(results), "results": results, "downloaded": downloaded}
 
     async def _gmail_create_draft(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create an email draft"""
-        import aiohttp
-        import base64
-        from email.mime.text import MIMEText
-
         message = MIMEText(params["body"])
         message["to"] = params["to"]
         message["subject"] = params["subject"]
@@ -2310,107 +3449,89 @@ class MCPClient:
         raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
         url = "https://gmail.googleapis.com/gmail/v1/users/me/drafts"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         payload = {"message": {"raw": raw_message}}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    draft = await response.json()
-                    return {"success": True, "draft_id": draft.get("id")}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(payload))
+        if response.status == 200:
+            draft = await _read_json(response)
+            return {"success": True, "draft_id": draft.get("id")}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_list_drafts(self, max_results: int = 10) -> Dict[str, Any]:
         """List email drafts"""
-        import aiohttp
-
-        url = f"https://gmail.googleapis.com/gmail/v1/users/me/drafts?maxResults={max_results}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    drafts = data.get("drafts", [])
-                    return {"success": True, "drafts": drafts, "count": len(drafts)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        url = "https://gmail.googleapis.com/gmail/v1/users/me/drafts"
+        headers = self._google_headers()
+        query_params = {"maxResults": max_results, "fields": "drafts(id,message(id,threadId))"}
+
+        response = await self._request("GET", url, headers=headers, params=query_params)
+        if response.status == 200:
+            data = await _read_json(response)
+            drafts = data.get("drafts", [])
+            return {"success": True, "drafts": drafts, "count": len(drafts)}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_send_draft(self, draft_id: str) -> Dict[str, Any]:
         """Send an existing draft"""
-        import aiohttp
-
         url = "https://gmail.googleapis.com/gmail/v1/users/me/drafts/send"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         payload = {"id": draft_id}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return {"success": True, "message_id": result.get("id")}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(payload))
+        if response.status == 200:
+            result = await _read_json(response)
+            return {"success": True, "message_id": result.get("id")}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_get_thread(self, thread_id: str) -> Dict[str, Any]:
         """Get full email thread/conversation"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/threads/{thread_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
+
+        # Only the summary headers and snippet are used, so skip bodies and other headers
+        params = [
+            ("format", "metadata"),
+            ("metadataHeaders", "From"),
+            ("metadataHeaders", "Subject"),
+            ("metadataHeaders", "Date"),
+            ("fields", "messages(id,snippet,payload/headers)"),
+        ]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    thread = await response.json()
-                    messages = thread.get("messages", [])
-
-                    # Extract key info from each message in thread
-                    thread_summary = []
-                    for msg in messages:
-                        headers_dict = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
-                        thread_summary.append({
-                            "id": msg["id"],
-                            "from": headers_dict.get("From", ""),
-                            "subject": headers_dict.get("Subject", ""),
-                            "date": headers_dict.get("Date", ""),
-                            "snippet": msg.get("snippet", "")
-                        })
+        async with self._stream_get("gmail", url, headers=headers, params=params) as response:
+            if response.status == 200:
+                # Extract key info from each message as it is parsed off the wire
+                thread_summary = []
+                async for msg in self._iter_json_items(response, "messages.item"):
+                    headers_dict = _extract_headers(msg.get("payload", {}), _SUMMARY_HEADERS)
+                    thread_summary.append({
+                        "id": msg["id"],
+                        "from": headers_dict.get("From", ""),
+                        "subject": headers_dict.get("Subject", ""),
+                        "date": headers_dict.get("Date", ""),
+                        "snippet": msg.get("snippet", "")
+                    })
 
-                    return {
-                        "success": True,
-                        "thread_id": thread_id,
-                        "messages": thread_summary,
-                        "count": len(messages)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+                return {
+                    "success": True,
+                    "thread_id": thread_id,
+                    "messages": thread_summary,
+                    "count": len(thread_summary)
+                }
+            else:
+                return await _api_error("Gmail", response)
 
     # =================== NEW CALENDAR METHODS ===================
 
     async def _calendar_create_event_advanced(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create event with all advanced features"""
-        import aiohttp
-
         calendar_id = params.get("calendar_id", "primary")
         url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         event = {
             "summary": params["summary"]
@@ -2418,11 +3539,11 @@ class MCPClient:
 
         # Handle all-day vs timed events
         if params.get("all_day"):
-            event["start"] = {"date": params["start_time"].split("T")[0]}
-            event["end"] = {"date": params["end_time"].split("T")[0]}
+            event["start"] = {"date": _event_date(params["start_time"])}
+            event["end"] = {"date": _event_date(params["end_time"])}
         else:
-            event["start"] = {"dateTime": params["start_time"]}
-            event["end"] = {"dateTime": params["end_time"]}
+            event["start"] = {"dateTime": _event_time(params["start_time"])}
+            event["end"] = {"dateTime": _event_time(params["end_time"])}
 
             if params.get("timezone"):
                 event["start"]["timeZone"] = params["timezone"]
@@ -2442,89 +3563,82 @@ class MCPClient:
         if params.get("reminders"):
             event["reminders"] = {"useDefault": False, "overrides": params["reminders"]}
 
+        # Only the fields returned below are needed from the created event
+        query_params = {"fields": "id,htmlLink,summary,conferenceData/entryPoints/uri"}
+
         # Add Google Meet
         if params.get("add_meet"):
             event["conferenceData"] = {
                 "createRequest": {
-                    "requestId": f"meet-{params['summary'][:10]}-{hash(params['start_time'])}"
+                    "requestId": f"meet-{uuid.uuid4().hex}"  # Must be unique per new conference
                 }
             }
-            url += "?conferenceDataVersion=1"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=event) as response:
-                if response.status in [200, 201]:
-                    result = await response.json()
-                    return_data = {
-                        "success": True,
-                        "event_id": result.get("id"),
-                        "html_link": result.get("htmlLink"),
-                        "summary": result.get("summary")
-                    }
+            query_params["conferenceDataVersion"] = 1
+
+        response = await self._request("POST", url, headers=headers, params=query_params, data=_dump_json(event))
+        if response.status in [200, 201]:
+            result = await _read_json(response)
+            return_data = {
+                "success": True,
+                "event_id": result.get("id"),
+                "html_link": result.get("htmlLink"),
+                "summary": result.get("summary")
+            }
 
-                    # Include Google Meet link if created
-                    if result.get("conferenceData"):
-                        meet_link = result["conferenceData"].get("entryPoints", [{}])[0].get("uri")
-                        if meet_link:
-                            return_data["meet_link"] = meet_link
+            # Include Google Meet link if created
+            if result.get("conferenceData"):
+                meet_link = result["conferenceData"].get("entryPoints", [{}])[0].get("uri")
+                if meet_link:
+                    return_data["meet_link"] = meet_link
 
-                    return return_data
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            return return_data
+        else:
+            return await _api_error("Calendar", response)
 
     async def _calendar_search_events(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search calendar events by keyword"""
-        import aiohttp
-
         calendar_id = params.get("calendar_id", "primary")
         query = params["query"]
         max_results = params.get("max_results", 10)
 
         url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
         query_params = {
             "q": query,
             "maxResults": max_results,
             "singleEvents": "true",
-            "orderBy": "startTime"
+            "orderBy": "startTime",
+            "fields": "items(id,summary,start,end,location,description)"
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=query_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    events = []
-
-                    for item in data.get("items", []):
-                        events.append({
-                            "id": item.get("id"),
-                            "summary": item.get("summary", "No title"),
-                            "start": item.get("start", {}).get("dateTime") or item.get("start", {}).get("date"),
-                            "end": item.get("end", {}).get("dateTime") or item.get("end", {}).get("date"),
-                            "location": item.get("location"),
-                            "description": item.get("description")
-                        })
+        response = await self._request("GET", url, headers=headers, params=query_params)
+        if response.status == 200:
+            data = await _read_json(response)
+            events = []
+
+            for item in data.get("items", []):
+                events.append({
+                    "id": item.get("id"),
+                    "summary": item.get("summary", "No title"),
+                    "start": item.get("start", {}).get("dateTime") or item.get("start", {}).get("date"),
+                    "end": item.get("end", {}).get("dateTime") or item.get("end", {}).get("date"),
+                    "location": item.get("location"),
+                    "description": item.get("description")
+                })
 
-                    return {
-                        "success": True,
-                        "events": events,
-                        "count": len(events)
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            return {
+                "success": True,
+                "events": events,
+                "count": len(events)
+            }
+        else:
+            return await _api_error("Calendar", response)
 
     async def _calendar_check_free_busy(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Check free/busy status"""
-        import aiohttp
-
         url = "https://www.googleapis.com/calendar/v3/freeBusy"
-        headers = {
-            "Authorization": f"Bearer {self._get_active_google_token()}",
-            "Content-Type": "application/json"
-        }
+        headers = self._google_headers(json_body=True)
 
         calendar_ids = params.get("calendar_ids", ["primary"])
         payload = {
@@ -2533,27 +3647,27 @@ class MCPClient:
             "items": [{"id": cal_id} for cal_id in calendar_ids]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    calendars = data.get("calendars", {})
-
-                    result = {}
-                    for cal_id, cal_data in calendars.items():
-                        busy_times = cal_data.get("busy", [])
-                        result[cal_id] = {
-                            "busy": busy_times,
-                            "is_free": len(busy_times) == 0
-                        }
+        response = await self._request(
+            "POST", url, headers=headers, params={"fields": "calendars"}, data=_dump_json(payload)
+        )
+        if response.status == 200:
+            data = await _read_json(response)
+            calendars = data.get("calendars", {})
+
+            result = {}
+            for cal_id, cal_data in calendars.items():
+                busy_times = cal_data.get("busy", [])
+                result[cal_id] = {
+                    "busy": busy_times,
+                    "is_free": len(busy_times) == 0
+                }
 
-                    return {
-                        "success": True,
-                        "calendars": result
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+            return {
+                "success": True,
+                "calendars": result
+            }
+        else:
+            return await _api_error("Calendar", response)
 
     async def chat_with_tools(
         self,
@@ -2577,7 +3691,9 @@ class MCPClient:
         self.active_account = active_account
         logger.info(f"Using {active_account} account for Google tools")
 
-        current_messages = messages.copy()
+        # The caller's history is only copied once a tool turn has to be appended to it,
+        # so plain replies never pay for the copy
+        current_messages = messages
 
         for turn in range(max_turns):
             logger.info(f"Tool execution turn {turn + 1}/{max_turns}")
@@ -2596,26 +3712,35 @@ class MCPClient:
             # Check if Claude wants to use tools
             if response.stop_reason == "tool_use":
                 # Extract tool calls
-                tool_results = []
+                tool_blocks = [block for block in response.content if isinstance(block, ToolUseBlock)]
 
-                for content_block in response.content:
-                    if isinstance(content_block, ToolUseBlock):
-                        tool_name = content_block.name
-                        tool_input = content_block.input
-                        tool_use_id = content_block.id
+                if len(tool_blocks) == 1:
+                    block = tool_blocks[0]
+                    logger.info(f"Claude wants to use tool: {block.name}")
+                    results = [await self.execute_tool(block.name, block.input)]
+                else:
+                    semaphore = asyncio.Semaphore(self._TOOL_CONCURRENCY)
 
-                        logger.info(f"Claude wants to use tool: {tool_name}")
+                    async def run_tool(content_block: ToolUseBlock) -> Dict[str, Any]:
+                        logger.info(f"Claude wants to use tool: {content_block.name}")
+                        async with semaphore:
+                            return await self.execute_tool(content_block.name, content_block.input)
 
-                        # Execute the tool
-                        result = await self.execute_tool(tool_name, tool_input)
+                    # Tool calls within one turn are independent, so execute them concurrently
+                    results = await asyncio.gather(*(run_tool(block) for block in tool_blocks))
 
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_use_id,
-                            "content": json.dumps(result)
-                        })
+                tool_results = [
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": block.id,
+                        "content": _dump_json(result).decode()
+                    }
+                    for block, result in zip(tool_blocks, results)
+                ]
 
                 # Add assistant message and tool results to conversation
+                if current_messages is messages:
+                    current_messages = list(messages)
                 current_messages.append({
                     "role": "assistant",
                     "content": response.content
@@ -2645,17 +3770,25 @@ class MCPClient:
         """
         Fetch a secret from Google Secret Manager
         Returns None if secret doesn't exist or can't be accessed
+        Values are cached for _SECRET_CACHE_TTL and the client is reused.
         """
+        key = (project_id, secret_name)
+        cached = self._secret_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._SECRET_CACHE_TTL:
+            return cached[1]
+
         try:
-            from google.cloud import secretmanager
+            if self._secrets_client is None:
+                from google.cloud import secretmanager
 
-            client = secretmanager.SecretManagerServiceClient()
+                self._secrets_client = secretmanager.SecretManagerServiceClient()
             name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
 
-            response = client.access_secret_version(request={"name": name})
+            response = self._secrets_client.access_secret_version(request={"name": name})
             secret_value = response.payload.data.decode("UTF-8")
 
             logger.info(f"Successfully retrieved secret: {secret_name}")
+            self._secret_cache[key] = (time.monotonic(), secret_value)
             return secret_value
 
         except Exception as e:
@@ -2666,11 +3799,9 @@ class MCPClient:
 
     async def _todoist_update_label(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Todoist label"""
-        import aiohttp
-
         label_id = params["label_id"]
         url = f"https://api.todoist.com/rest/v2/labels/{label_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
+        headers = self._todoist_headers_json
 
         update_data = {}
         if "name" in params:
@@ -2678,253 +3809,224 @@ class MCPClient:
         if "color" in params:
             update_data["color"] = params["color"]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=update_data) as response:
-                if response.status == 200:
-                    label = await response.json()
-                    return {"success": True, "label": label}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(update_data))
+        if response.status == 200:
+            label = await _read_json(response)
+            return {"success": True, "label": label}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_delete_label(self, label_id: str) -> Dict[str, Any]:
         """Delete a Todoist label"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/labels/{label_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True, "message": "Label deleted"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return _LABEL_DELETED
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_update_section(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Todoist section"""
-        import aiohttp
-
         section_id = params["section_id"]
         url = f"https://api.todoist.com/rest/v2/sections/{section_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
+        headers = self._todoist_headers_json
 
         update_data = {"name": params["name"]}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=update_data) as response:
-                if response.status == 200:
-                    section = await response.json()
-                    return {"success": True, "section": section}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(update_data))
+        if response.status == 200:
+            section = await _read_json(response)
+            return {"success": True, "section": section}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_delete_section(self, section_id: str) -> Dict[str, Any]:
         """Delete a Todoist section"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/sections/{section_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True, "message": "Section deleted"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return _SECTION_DELETED
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_update_comment(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Update a Todoist comment"""
-        import aiohttp
-
         comment_id = params["comment_id"]
         url = f"https://api.todoist.com/rest/v2/comments/{comment_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}", "Content-Type": "application/json"}
+        headers = self._todoist_headers_json
 
         update_data = {"content": params["content"]}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=update_data) as response:
-                if response.status == 200:
-                    comment = await response.json()
-                    return {"success": True, "comment": comment}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(update_data))
+        if response.status == 200:
+            comment = await _read_json(response)
+            return {"success": True, "comment": comment}
+        else:
+            return await _api_error("Todoist", response)
 
     async def _todoist_delete_comment(self, comment_id: str) -> Dict[str, Any]:
         """Delete a Todoist comment"""
-        import aiohttp
-
         url = f"https://api.todoist.com/rest/v2/comments/{comment_id}"
-        headers = {"Authorization": f"Bearer {self.todoist_token}"}
+        headers = self._todoist_headers
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True, "message": "Comment deleted"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Todoist API error: {response.status} - {error_text}"}
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return _COMMENT_DELETED
+        else:
+            return await _api_error("Todoist", response)
 
     # ===== ADDITIONAL GMAIL IMPLEMENTATIONS =====
 
     async def _gmail_delete_draft(self, draft_id: str) -> Dict[str, Any]:
         """Delete a Gmail draft"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/drafts/{draft_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True, "message": "Draft deleted"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return _DRAFT_DELETED
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_create_filter(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a Gmail filter"""
-        import aiohttp
-
         url = "https://gmail.googleapis.com/gmail/v1/users/me/settings/filters"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}", "Content-Type": "application/json"}
+        headers = self._google_headers(json_body=True)
 
         filter_data = {
             "criteria": params["criteria"],
             "action": params["action"]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=filter_data) as response:
-                if response.status == 200:
-                    filter_result = await response.json()
-                    return {"success": True, "filter": filter_result}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("POST", url, headers=headers, data=_dump_json(filter_data))
+        if response.status == 200:
+            filter_result = await _read_json(response)
+            return {"success": True, "filter": filter_result}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_list_filters(self) -> Dict[str, Any]:
         """List all Gmail filters"""
-        import aiohttp
-
         url = "https://gmail.googleapis.com/gmail/v1/users/me/settings/filters"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    filters = data.get("filter", [])
-                    return {"success": True, "filters": filters, "count": len(filters)}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response, data = await self._get_json_revalidated(url, headers=headers)
+        if data is not None:
+            filters = data.get("filter", [])
+            return {"success": True, "filters": filters, "count": len(filters)}
+        else:
+            return await _api_error("Gmail", response)
 
     async def _gmail_delete_filter(self, filter_id: str) -> Dict[str, Any]:
         """Delete a Gmail filter"""
-        import aiohttp
-
         url = f"https://gmail.googleapis.com/gmail/v1/users/me/settings/filters/{filter_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(url, headers=headers) as response:
-                if response.status == 204:
-                    return {"success": True, "message": "Filter deleted"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Gmail API error: {response.status} - {error_text}"}
+        response = await self._request("DELETE", url, headers=headers, read_body=False)
+        if response.status == 204:
+            return _FILTER_DELETED
+        else:
+            return await _api_error("Gmail", response)
 
     # ===== ADDITIONAL CALENDAR IMPLEMENTATIONS =====
 
     async def _calendar_add_attendee(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Add an attendee to a calendar event"""
-        import aiohttp
-
         calendar_id = params.get("calendar_id", "primary")
         event_id = params["event_id"]
 
-        # First, get the current event
+        # First, get the current attendee list; PATCH replaces the whole array
         get_url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events/{event_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
+        headers = self._google_headers()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(get_url, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
-
-                event = await response.json()
+        response = await self._request("GET", get_url, headers=headers, params={"fields": "attendees"})
+        if response.status != 200:
+            return await _api_error("Calendar", response)
 
-            # Add the new attendee
-            attendees = event.get("attendees", [])
-            new_attendee = {
-                "email": params["email"],
-                "optional": params.get("optional", False)
-            }
-            attendees.append(new_attendee)
-            event["attendees"] = attendees
+        event = await _read_json(response)
 
-            # Update the event
-            headers["Content-Type"] = "application/json"
-            async with session.put(get_url, headers=headers, json=event) as response:
-                if response.status == 200:
-                    updated_event = await response.json()
-                    return {"success": True, "event": updated_event, "message": f"Added {params['email']} as attendee"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+        # Add the new attendee
+        attendees = event.get("attendees", [])
+        new_attendee = {
+            "email": params["email"],
+            "optional": params.get("optional", False)
+        }
+        attendees.append(new_attendee)
+
+        # Patch only the attendees instead of re-sending the whole event
+        headers = self._google_headers(json_body=True)
+        response = await self._request(
+            "PATCH", get_url, headers=headers, data=_dump_json({"attendees": attendees})
+        )
+        if response.status == 200:
+            updated_event = await _read_json(response)
+            return {"success": True, "event": updated_event, "message": f"Added {params['email']} as attendee"}
+        else:
+            return await _api_error("Calendar", response)
 
     async def _calendar_remove_attendee(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Remove an attendee from a calendar event"""
-        import aiohttp
-
         calendar_id = params.get("calendar_id", "primary")
         event_id = params["event_id"]
         email_to_remove = params["email"]
 
-        # First, get the current event
+        # First, get the current attendee list; PATCH replaces the whole array
         get_url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events/{event_id}"
-        headers = {"Authorization": f"Bearer {self._get_active_google_token()}"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(get_url, headers=headers) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
-
-                event = await response.json()
-
-            # Remove the attendee
-            attendees = event.get("attendees", [])
-            original_count = len(attendees)
-            attendees = [a for a in attendees if a.get("email") != email_to_remove]
-
-            if len(attendees) == original_count:
-                return {"success": False, "error": f"Attendee {email_to_remove} not found"}
-
-            event["attendees"] = attendees
+        headers = self._google_headers()
+
+        response = await self._request("GET", get_url, headers=headers, params={"fields": "attendees"})
+        if response.status != 200:
+            return await _api_error("Calendar", response)
+
+        event = await _read_json(response)
+
+        # Remove the attendee
+        attendees = event.get("attendees", [])
+        # Calendar never lists an email twice, so stop at the first match
+        index = next((i for i, a in enumerate(attendees) if a.get("email") == email_to_remove), -1)
+        if index < 0:
+            return {"success": False, "error": f"Attendee {email_to_remove} not found"}
+        attendees.pop(index)
+
+        # Patch only the attendees instead of re-sending the whole event
+        headers = self._google_headers(json_body=True)
+        response = await self._request(
+            "PATCH", get_url, headers=headers, data=_dump_json({"attendees": attendees})
+        )
+        if response.status == 200:
+            updated_event = await _read_json(response)
+            return {"success": True, "event": updated_event, "message": f"Removed {email_to_remove} from attendees"}
+        else:
+            return await _api_error("Calendar", response)
 
-            # Update the event
-            headers["Content-Type"] = "application/json"
-            async with session.put(get_url, headers=headers, json=event) as response:
-                if response.status == 200:
-                    updated_event = await response.json()
-                    return {"success": True, "event": updated_event, "message": f"Removed {email_to_remove} from attendees"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Calendar API error: {response.status} - {error_text}"}
+    async def _run_batch(self, handler, params_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run one read-only handler over several inputs concurrently; the
+        backend bulkheads bound how many actually hit the API at once.
+        """
+        async def _one(params: Dict[str, Any]) -> Dict[str, Any]:
+            # Caught here so one failure doesn't cancel the rest of the task group
+            try:
+                return await handler(params)
+            except BotError as e:
+                return {"success": False, "error": e.user_message}
+            except Exception as e:
+                return {"success": False, "error": str(e)[:_MAX_ERROR_TEXT]}
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_one(params)) for params in params_list]
+
+        results = [task.result() for task in tasks]
+        succeeded = sum(1 for r in results if r.get("success"))
+        return {"success": succeeded == len(results), "results": results, "succeeded": succeeded}
 
     # Google Maps tools implementation
     async def _google_maps_search_places(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search for places using Google Maps Places API"""
-        import aiohttp
-
         query = params["query"]
         location = params.get("location", "")
         radius = params.get("radius", 5000)
@@ -2944,42 +4046,40 @@ class MCPClient:
         if place_type:
             request_params["type"] = place_type
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=request_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    if data.get("status") == "OK":
-                        results = data.get("results", [])
-                        places = []
-
-                        for place in results[:10]:  # Limit to top 10
-                            places.append({
-                                "name": place.get("name"),
-                                "address": place.get("formatted_address"),
-                                "place_id": place.get("place_id"),
-                                "rating": place.get("rating"),
-                                "user_ratings_total": place.get("user_ratings_total"),
-                                "types": place.get("types", []),
-                                "location": place.get("geometry", {}).get("location"),
-                                "open_now": place.get("opening_hours", {}).get("open_now")
-                            })
-
-                        return {
-                            "success": True,
-                            "count": len(places),
-                            "places": places
-                        }
-                    else:
-                        return {"success": False, "error": f"Maps API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
+        response = await self._request("GET", url, params=request_params)
+        if response.status == 200:
+            data = await _read_json(response)
+
+            if data.get("status") == "OK":
+                results = data.get("results", [])
+                places = []
+
+                for place in islice(results, 10):  # Limit to top 10
+                    get = place.get
+                    places.append({
+                        "name": get("name"),
+                        "address": get("formatted_address"),
+                        "place_id": get("place_id"),
+                        "rating": get("rating"),
+                        "user_ratings_total": get("user_ratings_total"),
+                        "types": get("types") or [],
+                        "location": (get("geometry") or _EMPTY).get("location"),
+                        "open_now": (get("opening_hours") or _EMPTY).get("open_now")
+                    })
+
+                return {
+                    "success": True,
+                    "count": len(places),
+                    "places": places
+                }
+            else:
+                return {"success": False, "error": f"Maps API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
+        else:
+            error_text = await _error_text(response)
+            return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
 
     async def _google_maps_get_directions(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get directions between two locations"""
-        import aiohttp
-
         origin = params["origin"]
         destination = params["destination"]
         mode = params.get("mode", "driving")
@@ -2991,127 +4091,118 @@ class MCPClient:
             "origin": origin,
             "destination": destination,
             "mode": mode,
-            "alternatives": alternatives,
+            "alternatives": "true" if alternatives else "false",  # yarl rejects bool query values
             "key": self.google_maps_api_key
         }
 
         if departure_time:
             if departure_time.lower() == "now":
-                import time
                 request_params["departure_time"] = int(time.time())
             else:
-                # Parse ISO format timestamp
-                from datetime import datetime
                 try:
-                    dt = datetime.fromisoformat(departure_time.replace('Z', '+00:00'))
-                    request_params["departure_time"] = int(dt.timestamp())
-                except:
-                    pass
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=request_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    if data.get("status") == "OK":
-                        routes = []
-
-                        for route in data.get("routes", []):
-                            leg = route["legs"][0]  # First leg
-
-                            # Parse steps
-                            steps = []
-                            for step in leg.get("steps", []):
-                                steps.append({
-                                    "instruction": step.get("html_instructions", "").replace("<b>", "").replace("</b>", ""),
-                                    "distance": step.get("distance", {}).get("text"),
-                                    "duration": step.get("duration", {}).get("text"),
-                                    "travel_mode": step.get("travel_mode")
-                                })
-
-                            routes.append({
-                                "summary": route.get("summary"),
-                                "distance": leg.get("distance", {}).get("text"),
-                                "duration": leg.get("duration", {}).get("text"),
-                                "start_address": leg.get("start_address"),
-                                "end_address": leg.get("end_address"),
-                                "steps": steps
-                            })
-
-                        return {
-                            "success": True,
-                            "count": len(routes),
-                            "routes": routes
+                    request_params["departure_time"] = _parse_iso_timestamp(departure_time)
+                except ValueError:
+                    logger.warning(f"Ignoring unparseable departure_time: {departure_time}")
+
+        response = await self._request("GET", url, params=request_params)
+        if response.status == 200:
+            data = await _read_json(response)
+
+            if data.get("status") == "OK":
+                routes = []
+
+                for route in data.get("routes", []):
+                    leg = route["legs"][0]  # First leg
+
+                    # Parse steps
+                    steps = [
+                        {
+                            "instruction": _BOLD_TAG_RE.sub("", step.get("html_instructions", "")),
+                            "distance": (step.get("distance") or _EMPTY).get("text"),
+                            "duration": (step.get("duration") or _EMPTY).get("text"),
+                            "travel_mode": step.get("travel_mode")
                         }
-                    else:
-                        return {"success": False, "error": f"Directions API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
+                        for step in leg.get("steps") or ()
+                    ]
+
+                    routes.append({
+                        "summary": route.get("summary"),
+                        "distance": (leg.get("distance") or _EMPTY).get("text"),
+                        "duration": (leg.get("duration") or _EMPTY).get("text"),
+                        "start_address": leg.get("start_address"),
+                        "end_address": leg.get("end_address"),
+                        "steps": steps
+                    })
+
+                return {
+                    "success": True,
+                    "count": len(routes),
+                    "routes": routes
+                }
+            else:
+                return {"success": False, "error": f"Directions API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
+        else:
+            error_text = await _error_text(response)
+            return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
 
     async def _google_maps_get_place_details(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed information about a specific place"""
-        import aiohttp
-
         place_id = params["place_id"]
-        fields = params.get("fields", [
-            "name", "formatted_address", "formatted_phone_number", "website",
-            "opening_hours", "rating", "user_ratings_total", "reviews",
-            "price_level", "business_status"
-        ])
+        fields = params.get("fields")
+        if not fields:
+            fields = _DEFAULT_PLACE_FIELDS
+        elif isinstance(fields, list):
+            fields = ",".join(fields)
 
         url = "https://maps.googleapis.com/maps/api/place/details/json"
         request_params = {
             "place_id": place_id,
-            "fields": ",".join(fields) if isinstance(fields, list) else fields,
+            "fields": fields,
             "key": self.google_maps_api_key
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=request_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    if data.get("status") == "OK":
-                        result = data.get("result", {})
-
-                        # Format reviews if present
-                        reviews = []
-                        for review in result.get("reviews", [])[:5]:  # Top 5 reviews
-                            reviews.append({
-                                "author": review.get("author_name"),
-                                "rating": review.get("rating"),
-                                "text": review.get("text"),
-                                "time": review.get("relative_time_description")
-                            })
-
-                        return {
-                            "success": True,
-                            "place": {
-                                "name": result.get("name"),
-                                "address": result.get("formatted_address"),
-                                "phone": result.get("formatted_phone_number"),
-                                "website": result.get("website"),
-                                "rating": result.get("rating"),
-                                "user_ratings_total": result.get("user_ratings_total"),
-                                "price_level": result.get("price_level"),
-                                "business_status": result.get("business_status"),
-                                "opening_hours": result.get("opening_hours", {}).get("weekday_text", []),
-                                "is_open_now": result.get("opening_hours", {}).get("open_now"),
-                                "reviews": reviews
-                            }
-                        }
-                    else:
-                        return {"success": False, "error": f"Place Details API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
+        response = await self._request("GET", url, params=request_params)
+        if response.status == 200:
+            data = await _read_json(response)
+
+            if data.get("status") == "OK":
+                result = data.get("result", {})
+
+                # Format reviews if present
+                reviews = []
+                for review in islice(result.get("reviews") or (), 5):  # Top 5 reviews
+                    reviews.append({
+                        "author": review.get("author_name"),
+                        "rating": review.get("rating"),
+                        "text": review.get("text"),
+                        "time": review.get("relative_time_description")
+                    })
+
+                return {
+                    "success": True,
+                    "place": {
+                        "name": result.get("name"),
+                        "address": result.get("formatted_address"),
+                        "phone": result.get("formatted_phone_number"),
+                        "website": result.get("website"),
+                        "rating": result.get("rating"),
+                        "user_ratings_total": result.get("user_ratings_total"),
+                        "price_level": result.get("price_level"),
+                        "business_status": result.get("business_status"),
+                        "opening_hours": result.get("opening_hours", {}).get("weekday_text", []),
+                        "is_open_now": result.get("opening_hours", {}).get("open_now"),
+                        "reviews": reviews
+                    }
+                }
+            else:
+                return {"success": False, "error": f"Place Details API error: {data.get('status')} - {data.get('error_message', 'Unknown error')}"}
+        else:
+            error_text = await _error_text(response)
+            return {"success": False, "error": f"HTTP error: {response.status} - {error_text}"}
 
     # Web search implementation
     async def _google_web_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search the web using Google Custom Search API"""
-        import aiohttp
-
         query = params["query"]
         num_results = params.get("num_results", 5)
         search_type = params.get("search_type", "web")
@@ -3119,113 +4210,92 @@ class MCPClient:
         date_restrict = params.get("date_restrict", "")
 
         url = "https://www.googleapis.com/customsearch/v1"
-        request_params = {
-            "key": self.google_custom_search_api_key,
-            "cx": self.google_custom_search_engine_id,
-            "q": query,
-            "num": min(num_results, 10)  # API max is 10
-        }
-
-        if search_type == "image":
-            request_params["searchType"] = "image"
-
-        if site_restrict:
-            request_params["siteSearch"] = site_restrict
-            request_params["siteSearchFilter"] = "i"  # Include only this site
-
-        if date_restrict:
-            request_params["dateRestrict"] = date_restrict
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=request_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    items = data.get("items", [])
-                    results = []
-
-                    for item in items:
-                        if search_type == "image":
-                            results.append({
-                                "title": item.get("title"),
-                                "link": item.get("link"),
-                                "thumbnail": item.get("image", {}).get("thumbnailLink"),
-                                "context": item.get("image", {}).get("contextLink")
-                            })
-                        else:
-                            results.append({
-                                "title": item.get("title"),
-                                "link": item.get("link"),
-                                "snippet": item.get("snippet"),
-                                "display_link": item.get("displayLink")
-                            })
+        # Optional parameters are None when unused and dropped in one pass
+        request_params = {k: v for k, v in (
+            ("key", self.google_custom_search_api_key),
+            ("cx", self.google_custom_search_engine_id),
+            ("q", query),
+            ("num", min(num_results, 10)),  # API max is 10
+            ("searchType", "image" if search_type == "image" else None),
+            ("siteSearch", site_restrict or None),
+            ("siteSearchFilter", "i" if site_restrict else None),  # Include only this site
+            ("dateRestrict", date_restrict or None),
+        ) if v is not None}
+
+        response = await self._request("GET", url, params=request_params)
+        if response.status == 200:
+            data = await _read_json(response)
+
+            items = data.get("items", [])
+            # The result shape depends only on search_type, so pick the builder once
+            build_item = _image_search_item if search_type == "image" else _web_search_item
+            results = [build_item(item) for item in items]
 
-                    return {
-                        "success": True,
-                        "count": len(results),
-                        "results": results,
-                        "total_results": data.get("searchInformation", {}).get("totalResults"),
-                        "search_time": data.get("searchInformation", {}).get("searchTime")
-                    }
-                else:
-                    error_text = await response.text()
-                    return {"success": False, "error": f"Custom Search API error: {response.status} - {error_text}"}
+            return {
+                "success": True,
+                "count": len(results),
+                "results": results,
+                "total_results": data.get("searchInformation", {}).get("totalResults"),
+                "search_time": data.get("searchInformation", {}).get("searchTime")
+            }
+        else:
+            return await _api_error("Custom Search", response)
 
     async def _fetch_webpage(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Fetch webpage content using aiohttp + BeautifulSoup (fast, static content)"""
-        import aiohttp
-        from bs4 import BeautifulSoup
+        if BeautifulSoup is None:
+            return {"success": False, "error": "beautifulsoup4 is not installed"}
 
         url = params["url"]
         extract_links = params.get("extract_links", False)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; WhatsApp-Claude-Bot/1.0)"},
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status != 200:
-                        return {
-                            "success": False,
-                            "error": f"HTTP {response.status}: {response.reason}"
-                        }
+            session = await self._session("web")
+            async with self._bulkhead("web"), session.get(
+                url,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; WhatsApp-Claude-Bot/1.0)"},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status != 200:
+                    return {
+                        "success": False,
+                        "error": f"HTTP {response.status}: {response.reason}"
+                    }
 
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                html_content = await response.text()
+                soup = BeautifulSoup(html_content, 'html.parser')
 
-                    # Remove script, style, and other non-content tags
-                    for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-                        tag.decompose()
+                # Remove script, style, and other non-content tags
+                for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
+                    tag.decompose()
 
-                    # Extract main text content
-                    text_content = soup.get_text(separator='\n', strip=True)
+                # Extract main text content
+                text_content = soup.get_text(separator='\n', strip=True)
 
-                    # Clean up whitespace
-                    lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-                    clean_text = '\n'.join(lines)
+                # Clean up whitespace
+                lines = [line.strip() for line in text_content.split('\n') if line.strip()]
+                clean_text = '\n'.join(lines)
 
-                    result = {
-                        "success": True,
-                        "url": url,
-                        "title": soup.title.string if soup.title else "No title",
-                        "content": clean_text[:15000],  # Limit to 15k chars
-                        "content_length": len(clean_text),
-                        "truncated": len(clean_text) > 15000
-                    }
+                result = {
+                    "success": True,
+                    "url": url,
+                    "title": soup.title.string if soup.title else "No title",
+                    "content": clean_text[:15000],  # Limit to 15k chars
+                    "content_length": len(clean_text),
+                    "truncated": len(clean_text) > 15000
+                }
 
-                    # Extract links if requested
-                    if extract_links:
-                        links = []
-                        for a_tag in soup.find_all('a', href=True):
-                            href = a_tag['href']
-                            text = a_tag.get_text(strip=True)
-                            if href.startswith('http'):  # Only absolute URLs
-                                links.append({"url": href, "text": text})
-                        result["links"] = links[:100]  # Limit to 100 links
+                # Extract links if requested
+                if extract_links:
+                    links = []
+                    for a_tag in soup.find_all('a', href=True):
+                        href = a_tag['href']
+                        text = a_tag.get_text(strip=True)
+                        if href.startswith('http'):  # Only absolute URLs
+                            links.append({"url": href, "text": text})
+                    result["links"] = links[:100]  # Limit to 100 links
 
-                    return result
+                return result
 
         except aiohttp.ClientError as e:
             return {"success": False, "error": f"Network error: {str(e)}"}
@@ -3288,7 +4358,6 @@ class MCPClient:
                 # Take screenshot if requested
                 if take_screenshot:
                     screenshot_data = await page.screenshot(type="png", full_page=False)
-                    import base64
                     result["screenshot_base64"] = base64.b64encode(screenshot_data).decode('utf-8')
 
                 await browser.close()
@@ -0,0 +1,42 @@
+"""Stand-in aiohttp session and response for exercising MCPClient handlers offline"""
+
+import orjson
+from yarl import URL
+
+
+class FakeResponse:
+    def __init__(self, status: int = 200, body=b"", headers=None):
+        self.status = status
+        self._body = body if isinstance(body, bytes) else orjson.dumps(body)
+        self.headers = headers or {}
+        self.released = False
+        self.body_read = False
+
+    async def read(self) -> bytes:
+        self.body_read = True
+        return self._body
+
+    async def text(self) -> str:
+        return (await self.read()).decode("utf-8")
+
+    def release(self):
+        self.released = True
+
+
+class FakeSession:
+    """
+    Answers each request with responder(method, url, kwargs) -> FakeResponse.
+    The query string is built with yarl, as aiohttp does, so parameter
+    values it rejects fail here too.
+    """
+
+    closed = False
+
+    def __init__(self, responder):
+        self._responder = responder
+        self.requests = []  # [(method, URL with query, kwargs)]
+
+    async def request(self, method: str, url: str, **kwargs):
+        full_url = URL(url).with_query(kwargs.get("params") or {})
+        self.requests.append((method, full_url, kwargs))
+        return self._responder(method, full_url, kwargs)
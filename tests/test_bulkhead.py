@@ -0,0 +1,70 @@
+"""Tests for the AIMD concurrency limit on each backend"""
+
+import asyncio
+import unittest
+
+try:
+    from mcp_client import _AdaptiveBulkhead
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+class AdaptiveBulkheadTests(unittest.TestCase):
+    def test_failures_halve_down_to_the_floor(self):
+        bulkhead = _AdaptiveBulkhead(max_limit=8, target_latency=1.0, min_limit=2)
+        for expected in (4, 2, 2):
+            bulkhead.record(None, ok=False)
+            self.assertEqual(bulkhead.limit, expected)
+
+    def test_fast_successes_add_back_up_to_the_ceiling(self):
+        bulkhead = _AdaptiveBulkhead(max_limit=4, target_latency=1.0)
+        bulkhead.record(None, ok=False)
+        for _ in range(10):
+            bulkhead.record(0.1, ok=True)
+
+        self.assertEqual(bulkhead.limit, 4)
+
+    def test_slow_successes_hold_the_limit(self):
+        bulkhead = _AdaptiveBulkhead(max_limit=4, target_latency=1.0)
+        bulkhead.record(None, ok=False)
+        bulkhead.record(2.0, ok=True)
+
+        self.assertEqual(bulkhead.limit, 2)
+
+    def test_in_flight_requests_never_exceed_the_limit(self):
+        bulkhead = _AdaptiveBulkhead(max_limit=3, target_latency=1.0)
+        in_flight = peak = 0
+
+        async def work():
+            nonlocal in_flight, peak
+            async with bulkhead:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.001)
+                in_flight -= 1
+
+        async def scenario():
+            await asyncio.gather(*(work() for _ in range(12)))
+
+        asyncio.run(scenario())
+        self.assertEqual(peak, 3)
+
+    def test_raised_limit_admits_several_waiters(self):
+        bulkhead = _AdaptiveBulkhead(max_limit=4, target_latency=1.0)
+        bulkhead.limit = 1.0
+
+        async def scenario():
+            await bulkhead.acquire()
+            waiters = [asyncio.create_task(bulkhead.acquire()) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertFalse(any(w.done() for w in waiters))
+
+            bulkhead.limit = 4.0
+            await bulkhead.release()
+            await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Tests for CircuitBreaker state transitions"""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from error_handler import BotError, CircuitBreaker
+
+try:
+    from mcp_client import MCPClient
+except ImportError:  # Runtime dependencies from requirements.txt
+    MCPClient = None
+
+
+async def _fail():
+    raise ConnectionError("upstream down")
+
+
+async def _ok():
+    return "ok"
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=3, timeout=60)
+
+    def _fail_once(self):
+        with self.assertRaises(ConnectionError):
+            asyncio.run(self.breaker.call_async(_fail))
+
+    def _age_last_failure(self, seconds: int = 61):
+        self.breaker.last_failure_time = datetime.now() - timedelta(seconds=seconds)
+
+    def test_sporadic_failures_past_timeout_do_not_open(self):
+        for _ in range(5):
+            self._fail_once()
+            self._age_last_failure()
+
+        self.assertEqual(self.breaker.state, "CLOSED")
+        self.assertEqual(self.breaker.failure_count, 1)
+
+    def test_successes_do_not_reset_closed_count(self):
+        self._fail_once()
+        asyncio.run(self.breaker.call_async(_ok))
+        self._fail_once()
+        self._fail_once()
+
+        self.assertEqual(self.breaker.state, "OPEN")
+
+    def test_open_breaker_rejects_calls(self):
+        for _ in range(3):
+            self._fail_once()
+
+        with self.assertRaises(BotError):
+            asyncio.run(self.breaker.call_async(_ok))
+
+    def test_half_open_failure_reopens(self):
+        for _ in range(3):
+            self._fail_once()
+        self._age_last_failure()
+
+        self._fail_once()
+
+        self.assertEqual(self.breaker.state, "OPEN")
+        with self.assertRaises(BotError):
+            asyncio.run(self.breaker.call_async(_ok))
+
+    def test_half_open_success_closes_and_clears_count(self):
+        for _ in range(3):
+            self._fail_once()
+        self._age_last_failure()
+
+        self.assertEqual(asyncio.run(self.breaker.call_async(_ok)), "ok")
+
+        self.assertEqual(self.breaker.state, "CLOSED")
+        self.assertEqual(self.breaker.failure_count, 0)
+
+    def test_half_open_admits_a_single_probe(self):
+        for _ in range(3):
+            self._fail_once()
+        self._age_last_failure()
+
+        async def scenario():
+            release = asyncio.Event()
+
+            async def slow_ok():
+                await release.wait()
+                return "ok"
+
+            probe = asyncio.create_task(self.breaker.call_async(slow_ok))
+            await asyncio.sleep(0)
+            with self.assertRaises(BotError):
+                await self.breaker.call_async(_ok)
+            release.set()
+            return await probe
+
+        self.assertEqual(asyncio.run(scenario()), "ok")
+        self.assertEqual(self.breaker.state, "CLOSED")
+        self.assertEqual(asyncio.run(self.breaker.call_async(_ok)), "ok")
+
+    def test_sync_call_follows_the_same_transitions(self):
+        def fail():
+            raise ConnectionError("upstream down")
+
+        for _ in range(3):
+            with self.assertRaises(ConnectionError):
+                self.breaker.call(fail)
+        self.assertEqual(self.breaker.state, "OPEN")
+
+        self._age_last_failure()
+        self.assertEqual(self.breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(self.breaker.state, "CLOSED")
+
+
+@unittest.skipIf(MCPClient is None, "mcp_client dependencies missing")
+class OpenBreakerToolResultTests(unittest.TestCase):
+    def test_handler_reports_breaker_rejection(self):
+        client = MCPClient()
+        client.google_oauth_token = client.google_oauth_token_work = "token"
+        client.google_oauth_token_personal = None
+        breaker = client._breaker("gmail")
+        breaker.state = "OPEN"
+        breaker.last_failure_time = datetime.now()
+
+        result = asyncio.run(client.execute_tool("gmail_search", {"query": "from:me"}))
+
+        self.assertFalse(result["success"])
+        self.assertIn("temporarily unavailable", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
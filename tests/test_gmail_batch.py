@@ -0,0 +1,55 @@
+"""Regression tests for parsing Gmail batch (multipart/mixed) replies"""
+
+import json
+import unittest
+
+try:
+    from mcp_client import _parse_gmail_batch
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+BOUNDARY = "batch_abc123"
+CONTENT_TYPE = f"multipart/mixed; boundary={BOUNDARY}"
+
+
+def _part(index: int, status: str, payload: dict) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return (
+        f"--{BOUNDARY}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <response-item-{index}>\r\n\r\n"
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: application/json; charset=UTF-8\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body + b"\r\n"
+
+
+class ParseGmailBatchTests(unittest.TestCase):
+    def test_non_ascii_headers_and_snippets_survive(self):
+        first = {
+            "id": "m1",
+            "snippet": "Café — résumé attached",
+            "payload": {"headers": [{"name": "Subject", "value": "Café — résumé"}]},
+        }
+        second = {
+            "id": "m2",
+            "snippet": "日本語のテキスト 👋",
+            "payload": {"headers": [{"name": "From", "value": "Héllo Wörld <h@example.com>"}]},
+        }
+        raw = _part(0, "200 OK", first) + _part(1, "200 OK", second) + f"--{BOUNDARY}--\r\n".encode()
+
+        self.assertEqual(_parse_gmail_batch(raw, CONTENT_TYPE, 2), [first, second])
+
+    def test_failed_and_missing_items_stay_none(self):
+        ok = {"id": "m2", "snippet": "naïve"}
+        raw = (
+            _part(0, "404 Not Found", {"error": {"code": 404}})
+            + _part(1, "200 OK", ok)
+            + f"--{BOUNDARY}--\r\n".encode()
+        )
+
+        self.assertEqual(_parse_gmail_batch(raw, CONTENT_TYPE, 3), [None, ok, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
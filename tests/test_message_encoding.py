@@ -0,0 +1,135 @@
+"""Tests for the base64 and MIME helpers used by the Gmail handlers"""
+
+import asyncio
+import base64
+import io
+import unittest
+from email import policy
+from email.parser import BytesParser
+from unittest import mock
+
+try:
+    import mcp_client
+    from mcp_client import _build_raw_message, _decode_body_prefix, _mime_header, _stream_b64_field
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+def _b64url(data: bytes, padded: bool = True) -> str:
+    encoded = base64.urlsafe_b64encode(data).decode("ascii")
+    return encoded if padded else encoded.rstrip("=")
+
+
+async def _chunked(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def _stream(body: bytes, size: int, field: bytes = b"data"):
+    out = io.BytesIO()
+    written = asyncio.run(_stream_b64_field(_chunked(body, size), field, out))
+    return written, out.getvalue()
+
+
+class StreamB64FieldTests(unittest.TestCase):
+    # Lengths 0-2 mod 3 cover both padding lengths and none
+    PAYLOADS = [bytes(range(256)) * 3, bytes(range(256)) * 3 + b"\xff", bytes(range(256)) * 3 + b"\xfe\xff"]
+
+    def test_every_chunk_boundary(self):
+        for payload in self.PAYLOADS:
+            for padded in (True, False):
+                body = f'{{"size": {len(payload)}, "data": "{_b64url(payload, padded)}"}}'.encode()
+                for size in (1, 2, 3, 4, 5, 7, 64, len(body)):
+                    with self.subTest(length=len(payload), padded=padded, chunk=size):
+                        self.assertEqual(_stream(body, size), (len(payload), payload))
+
+    def test_key_split_across_chunks_after_a_similar_key(self):
+        payload = "naïve café".encode("utf-8")
+        body = f'{{"attachmentId": "x", "metadata": "y", "data": "{_b64url(payload)}"}}'.encode()
+        for size in range(1, 12):
+            with self.subTest(chunk=size):
+                self.assertEqual(_stream(body, size)[1], payload)
+
+    def test_empty_value(self):
+        self.assertEqual(_stream(b'{"data": ""}', 3), (0, b""))
+
+    def test_missing_or_truncated_field_raises(self):
+        with self.assertRaises(ValueError):
+            _stream(b'{"size": 0}', 4)
+        with self.assertRaises(ValueError):
+            _stream(b'{"data": "QUJD', 4)
+
+    def test_large_values_are_written_in_blocks(self):
+        payload = bytes(range(256)) * 40
+        body = f'{{"data": "{_b64url(payload)}"}}'.encode()
+        out = mock.Mock(wraps=io.BytesIO())
+        with mock.patch.object(mcp_client, "_WRITE_BLOCK_SIZE", 1024):
+            written = asyncio.run(_stream_b64_field(_chunked(body, 700), b"data", out))
+
+        self.assertEqual(written, len(payload))
+        self.assertGreater(out.write.call_count, 1)
+        self.assertEqual(b"".join(c.args[0] for c in out.write.call_args_list), payload)
+
+
+class DecodeBodyPrefixTests(unittest.TestCase):
+    def test_short_bodies_of_every_padding_length(self):
+        for n in range(12):
+            text = "abcdefghijk"[:n]
+            with self.subTest(length=n):
+                self.assertEqual(_decode_body_prefix(_b64url(text.encode(), padded=False)), text)
+
+    def test_prefix_is_cut_by_characters(self):
+        for text in ("a" * 50, "é" * 50, "日本" * 25, "👋" * 50, "a€👋" * 17):
+            encoded = _b64url(text.encode("utf-8"), padded=False)
+            for max_chars in (1, 2, 3, 7, 20, 49, 50, 51):
+                with self.subTest(text=text[:3], max_chars=max_chars):
+                    self.assertEqual(_decode_body_prefix(encoded, max_chars), text[:max_chars])
+
+    def test_slice_covers_worst_case_utf8(self):
+        # Four-byte characters throughout: the slice must still hold max_chars of them
+        text = "👋" * 6000
+        self.assertEqual(_decode_body_prefix(_b64url(text.encode("utf-8"))), text[:5000])
+
+
+class RawMessageTests(unittest.TestCase):
+    def _parse(self, raw: bytes):
+        return BytesParser(policy=policy.default).parsebytes(raw)
+
+    def test_ascii_message(self):
+        raw = _build_raw_message("a@example.com", "Hi", "Hello\n", "me@example.com", in_reply_to="<m1@x>")
+        message = self._parse(raw)
+
+        self.assertEqual(message["To"], "a@example.com")
+        self.assertEqual(message["In-Reply-To"], "<m1@x>")
+        self.assertEqual(message["References"], "<m1@x>")
+        self.assertEqual(message.get_content_charset(), "us-ascii")
+        self.assertEqual(message.get_content(), "Hello\n")
+
+    def test_non_ascii_headers_and_body_round_trip(self):
+        subject = "Réunion trimestrielle — budget et questions ouvertes pour l'équipe produit " * 2
+        body = "Grüße aus München\n日本語のテキスト 👋\n" * 10
+        raw = _build_raw_message("Héllo Wörld <h@example.com>, b@example.com", subject, body, "Sâad <me@example.com>")
+        message = self._parse(raw)
+
+        self.assertEqual(str(message["Subject"]), subject)
+        self.assertEqual(
+            [(a.display_name, a.addr_spec) for a in message["To"].addresses],
+            [("Héllo Wörld", "h@example.com"), ("", "b@example.com")]
+        )
+        self.assertEqual(message["From"].addresses[0].addr_spec, "me@example.com")
+        self.assertEqual(message.get_content(), body)
+
+    def test_lines_end_in_crlf_including_folds(self):
+        raw = _build_raw_message("Héllo <h@example.com>", "Ünïcödé " * 20, "Grüße " * 40, "me@example.com")
+
+        self.assertNotIn(b"\n", raw.replace(b"\r\n", b""))
+        self.assertTrue(all(len(line) <= 998 for line in raw.split(b"\r\n")))
+
+    def test_header_injection_is_flattened(self):
+        self.assertEqual(_mime_header("Hi\r\nBcc: victim@example.com"), "Hi Bcc: victim@example.com")
+        folded = _mime_header("Grüße\nBcc: victim@example.com")
+        self.assertNotIn("\nBcc", folded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Tests for the pooled-session request path behind every API call"""
+
+import asyncio
+import unittest
+
+try:
+    from mcp_client import MCPClient
+    from fakes import FakeResponse, FakeSession
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+class RequestBodyTests(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.responses = []
+
+    def _send(self, status: int, body=b"", **kwargs):
+        def reply(method, url, kwargs):
+            response = FakeResponse(status, body)
+            self.responses.append(response)
+            return response
+
+        self.client._sessions["gmail"] = FakeSession(reply)
+        return asyncio.run(self.client._request("POST", "https://gmail.googleapis.com/x", **kwargs))
+
+    def test_status_only_call_still_drains_a_body(self):
+        response = self._send(200, {"id": "m1", "labelIds": ["TRASH"]}, read_body=False)
+
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.body_read)
+        self.assertTrue(response.released)
+
+    def test_status_only_call_skips_the_read_for_204(self):
+        response = self._send(204, read_body=False)
+
+        self.assertFalse(response.body_read)
+        self.assertTrue(response.released)
+
+    def test_error_body_is_read_for_the_caller(self):
+        response = self._send(404, b"not found", read_body=False)
+
+        self.assertTrue(response.body_read)
+        self.assertEqual(asyncio.run(response.text()), "not found")
+
+
+class RevalidatedGetTests(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.sent_etags = []
+        self.client._sessions["gmail"] = FakeSession(self._reply)
+
+    def _reply(self, method, url, kwargs):
+        self.sent_etags.append(kwargs["headers"].get("If-None-Match"))
+        if url.path.endswith("/empty"):
+            return FakeResponse(200, b"")
+        if kwargs["headers"].get("If-None-Match") == f'"{url.path}"':
+            return FakeResponse(304)
+        return FakeResponse(200, {"filter": [{"id": url.path}]}, headers={"ETag": f'"{url.path}"'})
+
+    def _get(self, path: str):
+        return asyncio.run(self.client._get_json_revalidated(f"https://gmail.googleapis.com{path}", headers={}))
+
+    def test_unchanged_resource_comes_from_the_cache(self):
+        first = self._get("/filters")[1]
+        response, second = self._get("/filters")
+
+        self.assertEqual(response.status, 304)
+        self.assertEqual(second, first)
+        self.assertEqual(self.sent_etags, [None, '"/filters"'])
+
+    def test_empty_200_is_an_empty_resource(self):
+        response, data = self._get("/empty")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(data, {})
+
+    def test_cache_is_bounded_least_recently_used_first(self):
+        self.client._ETAG_CACHE_MAX_ENTRIES = 2
+        self._get("/a")
+        self._get("/b")
+        self._get("/a")  # Revalidated, so /b is now the oldest
+        self._get("/c")
+
+        cached_paths = [url.rsplit("/", 1)[1] for _, url in self.client._etag_cache]
+        self.assertEqual(cached_paths, ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
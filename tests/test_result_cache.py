@@ -0,0 +1,87 @@
+"""Tests for the read-only tool result cache"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+try:
+    from mcp_client import MCPClient
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.calls = []
+        self.now = 1000.0
+
+        async def dispatch(tool_name, tool_input):
+            self.calls.append(tool_name)
+            return {"success": not tool_input.get("fail"), "call": len(self.calls)}
+
+        self.client._dispatch_tool = dispatch
+        clock = mock.patch("mcp_client.time.monotonic", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def _run(self, tool_name: str, tool_input=None):
+        return asyncio.run(self.client.execute_tool(tool_name, tool_input or {}))
+
+    def test_repeat_call_within_ttl_is_served_from_cache(self):
+        first = self._run("todoist_list_projects")
+        self.now += MCPClient._RESULT_CACHE_TTL - 1
+
+        self.assertIs(self._run("todoist_list_projects"), first)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_entry_expires_after_ttl(self):
+        self._run("todoist_list_projects")
+        self.now += MCPClient._RESULT_CACHE_TTL
+
+        self.assertEqual(self._run("todoist_list_projects")["call"], 2)
+
+    def test_per_tool_ttl_overrides_default(self):
+        self._run("google_maps_search_places", {"query": "coffee"})
+        self.now += MCPClient._RESULT_CACHE_TTL * 2
+        self._run("google_maps_search_places", {"query": "coffee"})
+        self.now += MCPClient._RESULT_CACHE_TTLS["google_maps_search_places"]
+        self._run("google_maps_search_places", {"query": "coffee"})
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_failures_are_not_cached(self):
+        self._run("todoist_list_projects", {"fail": True})
+        self._run("todoist_list_projects", {"fail": True})
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_inputs_and_accounts_get_separate_entries(self):
+        self._run("todoist_list_sections", {"project_id": "1"})
+        self._run("todoist_list_sections", {"project_id": "2"})
+        self.client.active_account = "work"
+        self._run("todoist_list_sections", {"project_id": "1"})
+
+        self.assertEqual(len(self.calls), 3)
+
+    def test_write_invalidates_dependent_listings(self):
+        self._run("todoist_list_projects")
+        self._run("todoist_create_project", {"name": "Errands"})
+        self._run("todoist_list_projects")
+
+        self.assertEqual(self.calls, ["todoist_list_projects", "todoist_create_project", "todoist_list_projects"])
+
+    def test_cache_is_bounded_least_recently_used_first(self):
+        self.client._RESULT_CACHE_MAX_ENTRIES = 2
+        self._run("todoist_list_sections", {"project_id": "a"})
+        self._run("todoist_list_sections", {"project_id": "b"})
+        self._run("todoist_list_sections", {"project_id": "a"})  # Hit, so "b" is now the oldest
+        self._run("todoist_list_sections", {"project_id": "c"})
+        self._run("todoist_list_sections", {"project_id": "a"})
+        self._run("todoist_list_sections", {"project_id": "b"})
+
+        self.assertEqual(len(self.calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Tests for running the batch tools through the pooled-session request path"""
+
+import asyncio
+import unittest
+
+try:
+    from mcp_client import MCPClient
+    from fakes import FakeResponse, FakeSession
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+def _directions_reply(method, url, kwargs):
+    if url.query["origin"] == "nowhere":
+        return FakeResponse(body={"status": "NOT_FOUND"})
+    return FakeResponse(body={
+        "status": "OK",
+        "routes": [{
+            "summary": "A1",
+            "legs": [{
+                "distance": {"text": "5 km"},
+                "duration": {"text": "10 mins"},
+                "start_address": url.query["origin"],
+                "end_address": url.query["destination"],
+                "steps": [{"html_instructions": "Turn <b>left</b>", "travel_mode": "DRIVING"}],
+            }],
+        }],
+    })
+
+
+class DirectionsBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.client.google_maps_api_key = "test-key"
+        self.session = FakeSession(_directions_reply)
+        self.client._sessions["maps"] = self.session
+
+    def test_batch_sends_string_query_values(self):
+        result = asyncio.run(self.client._run_batch(
+            self.client._google_maps_get_directions,
+            [
+                {"origin": "Home", "destination": "Work", "alternatives": True},
+                {"origin": "Work", "destination": "Gym"},
+            ],
+        ))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["succeeded"], 2)
+        self.assertEqual(result["results"][0]["routes"][0]["steps"][0]["instruction"], "Turn left")
+        sent = sorted((url.query["origin"], url.query["alternatives"]) for _, url, _ in self.session.requests)
+        self.assertEqual(sent, [("Home", "true"), ("Work", "false")])
+
+    def test_one_failed_route_does_not_fail_the_rest(self):
+        result = asyncio.run(self.client._run_batch(
+            self.client._google_maps_get_directions,
+            [
+                {"origin": "nowhere", "destination": "Work"},
+                {"origin": "Home", "destination": "Work"},
+            ],
+        ))
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["succeeded"], 1)
+        self.assertIn("NOT_FOUND", result["results"][0]["error"])
+        self.assertEqual(result["results"][1]["routes"][0]["end_address"], "Work")
+
+
+if __name__ == "__main__":
+    unittest.main()
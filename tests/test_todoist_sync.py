@@ -0,0 +1,90 @@
+"""Tests for batching Todoist writes into Sync API requests"""
+
+import asyncio
+import unittest
+
+try:
+    import orjson
+    from mcp_client import MCPClient
+    from fakes import FakeResponse, FakeSession
+except ImportError as exc:  # Runtime dependencies from requirements.txt
+    raise unittest.SkipTest(f"mcp_client dependencies missing: {exc}")
+
+
+class TodoistSyncTests(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.client._todoist_headers = {"Authorization": "Bearer test"}
+        self.batches = []  # command lists, one per Sync request
+        self.skip_status = set()  # command types the fake server leaves out of sync_status
+        self.session = FakeSession(self._reply)
+        self.client._sessions["todoist"] = self.session
+
+    def _reply(self, method, url, kwargs):
+        if url.path == "/sync/v9/sync":
+            commands = orjson.loads(kwargs["data"]["commands"])
+            self.batches.append(commands)
+            return FakeResponse(body={
+                "sync_status": {c["uuid"]: "ok" for c in commands if c["type"] not in self.skip_status},
+                "temp_id_mapping": {c["temp_id"]: f"id-{i}" for i, c in enumerate(commands) if "temp_id" in c},
+            })
+        resource, object_id = url.path.rsplit("/", 2)[-2:]
+        return FakeResponse(body={"id": object_id, "name": f"{resource} from server", "url": "https://todoist.com/x"})
+
+    def test_commands_within_the_window_share_one_request(self):
+        async def scenario():
+            return await asyncio.gather(
+                self.client._todoist_command("project_update", {"id": "p1", "name": "A"}),
+                self.client._todoist_command("project_update", {"id": "p2", "name": "B"}),
+                self.client._todoist_command("project_delete", {"id": "p3"}),
+            )
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([r["id"] for r in results], ["p1", "p2", "p3"])
+
+    def test_full_batch_flushes_without_waiting(self):
+        self.client._TODOIST_BATCH_WINDOW = 0.5  # Long enough that only the size cap explains a fast flush
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            first = [
+                asyncio.create_task(self.client._todoist_command("project_delete", {"id": f"p{i}"}))
+                for i in range(MCPClient._TODOIST_BATCH_MAX)
+            ]
+            late = asyncio.create_task(self.client._todoist_command("project_delete", {"id": "late"}))
+            await asyncio.gather(*first)
+            first_done = loop.time() - started
+            await late
+            return first_done
+
+        first_done = asyncio.run(scenario())
+
+        self.assertEqual([len(b) for b in self.batches], [MCPClient._TODOIST_BATCH_MAX, 1])
+        self.assertLess(first_done, self.client._TODOIST_BATCH_WINDOW)
+
+    def test_missing_status_is_reported(self):
+        self.skip_status.add("project_delete")
+
+        result = asyncio.run(self.client._todoist_command("project_delete", {"id": "p1"}))
+
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "Todoist API error: no status for command project_delete")
+
+    def test_create_returns_the_server_object(self):
+        result = asyncio.run(self.client._todoist_create_project({"name": "Errands"}))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["project"]["id"], "id-0")
+        self.assertEqual(result["project"]["url"], "https://todoist.com/x")
+
+    def test_delete_project_identifies_what_was_deleted(self):
+        result = asyncio.run(self.client._todoist_delete_project("p1"))
+
+        self.assertEqual(result, {"success": True, "message": "Project deleted"})
+
+
+if __name__ == "__main__":
+    unittest.main()